@@ -46,7 +46,7 @@ def snake_to_camel(snake_str: str) -> str:
     return components[0] + "".join(x.title() for x in components[1:])
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentInstance:
     """Represents an instance of a component in the timeline."""
 
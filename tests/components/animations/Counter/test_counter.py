@@ -6,6 +6,7 @@ Tests for Counter template generation.
 from tests.components.conftest import (
     assert_has_interface,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -122,7 +123,7 @@ class TestCounterToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(end_value=100, duration=2.0))
 
@@ -144,7 +145,7 @@ class TestCounterToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(end_value=100, duration=2.0))
 
@@ -169,7 +170,7 @@ class TestCounterToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(end_value=100, duration=2.0))
 
@@ -10,6 +10,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -107,7 +108,7 @@ class TestLayoutEntranceToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Create valid content
         content = json.dumps({"type": "Grid", "config": {"layout": "3x3"}})
@@ -132,7 +133,7 @@ class TestLayoutEntranceToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         content = json.dumps({"type": "Container", "config": {"position": "center"}})
 
@@ -181,7 +182,7 @@ class TestLayoutEntranceToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         content = json.dumps({"type": "TitleScene", "config": {"text": "Hello"}})
 
@@ -206,7 +207,7 @@ class TestLayoutEntranceToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         content = json.dumps({"type": "TitleScene", "config": {"text": "Hello"}})
 
@@ -232,7 +233,7 @@ class TestLayoutEntranceToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(
             tool_func(
@@ -256,7 +257,7 @@ class TestLayoutEntranceToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Missing 'type' key
         content = json.dumps({"config": {"text": "Missing type"}})
@@ -278,7 +279,7 @@ class TestLayoutEntranceToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         content = json.dumps({"type": "TitleScene", "config": {"text": "Hello"}})
 
@@ -301,7 +302,7 @@ class TestLayoutEntranceToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         content = json.dumps({"type": "TitleScene", "config": {"text": "Hello"}})
 
@@ -10,6 +10,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -121,7 +122,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Create valid items array
         items = json.dumps(
@@ -151,7 +152,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         items = json.dumps(
             [
@@ -203,7 +204,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         items = json.dumps(
             [
@@ -232,7 +233,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         items = json.dumps([{"type": "CodeBlock", "config": {}}])
 
@@ -258,7 +259,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(
             tool_func(
@@ -281,7 +282,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Items is a dict, not an array
         items = json.dumps({"not": "an array"})
@@ -304,7 +305,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Missing 'type' key in one item
         items = json.dumps(
@@ -331,7 +332,7 @@ class TestPanelCascadeToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         items = json.dumps([{"type": "CodeBlock", "config": {}}])
 
@@ -354,7 +355,7 @@ class TestPanelCascadeToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         items = json.dumps([{"type": "CodeBlock", "config": {}}])
 
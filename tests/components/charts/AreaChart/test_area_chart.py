@@ -6,6 +6,7 @@ Tests for AreaChart template generation.
 from tests.components.conftest import (
     assert_has_interface,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -160,7 +161,7 @@ class TestAreaChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -182,7 +183,7 @@ class TestAreaChartToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -205,7 +206,7 @@ class TestAreaChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_area_chart to raise exception
         with patch.object(timeline, "add_area_chart", side_effect=Exception("Test error")):
@@ -230,7 +231,7 @@ class TestAreaChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data="invalid json {[}", title="Test", duration=4.0))
 
@@ -6,6 +6,7 @@ Tests for BarChart template generation.
 from tests.components.conftest import (
     assert_has_interface,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -157,7 +158,7 @@ class TestBarChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -179,7 +180,7 @@ class TestBarChartToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -202,7 +203,7 @@ class TestBarChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_bar_chart to raise exception
         with patch.object(timeline, "add_bar_chart", side_effect=Exception("Test error")):
@@ -227,7 +228,7 @@ class TestBarChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data="invalid json {[}", title="Test", duration=4.0))
 
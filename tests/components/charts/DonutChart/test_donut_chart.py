@@ -6,6 +6,7 @@ Tests for DonutChart template generation.
 from tests.components.conftest import (
     assert_has_interface,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -149,7 +150,7 @@ class TestDonutChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -171,7 +172,7 @@ class TestDonutChartToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -194,7 +195,7 @@ class TestDonutChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_donut_chart to raise exception
         with patch.object(timeline, "add_donut_chart", side_effect=Exception("Test error")):
@@ -219,7 +220,7 @@ class TestDonutChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data="invalid json {[}", title="Test", duration=4.0))
 
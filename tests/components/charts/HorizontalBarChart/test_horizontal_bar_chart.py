@@ -6,6 +6,7 @@ Tests for HorizontalBarChart template generation.
 from tests.components.conftest import (
     assert_has_interface,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -156,7 +157,7 @@ class TestHorizontalBarChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -178,7 +179,7 @@ class TestHorizontalBarChartToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -201,7 +202,7 @@ class TestHorizontalBarChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_horizontal_bar_chart to raise exception
         with patch.object(
@@ -228,7 +229,7 @@ class TestHorizontalBarChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data="invalid json {[}", title="Test", duration=4.0))
 
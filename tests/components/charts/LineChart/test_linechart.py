@@ -8,6 +8,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -320,7 +321,7 @@ class TestLineChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -342,7 +343,7 @@ class TestLineChartToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data='[{"label": "A", "value": 10}]', duration=4.0))
 
@@ -365,7 +366,7 @@ class TestLineChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_line_chart to raise exception
         with patch.object(timeline, "add_line_chart", side_effect=Exception("Test error")):
@@ -390,7 +391,7 @@ class TestLineChartToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(data="invalid json {[}", title="Test", duration=4.0))
 
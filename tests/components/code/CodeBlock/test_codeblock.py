@@ -9,6 +9,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -270,7 +271,7 @@ class TestCodeBlockToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(code="test", duration=5.0))
 
@@ -292,7 +293,7 @@ class TestCodeBlockToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(code="test", duration=5.0))
 
@@ -315,7 +316,7 @@ class TestCodeBlockToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_code_block to raise exception
         with patch.object(timeline, "add_code_block", side_effect=Exception("Test error")):
@@ -5,6 +5,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -120,7 +121,7 @@ class TestCodeDiffToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Execute with all parameters
         lines = json.dumps([{"type": "added", "content": "new line"}])
@@ -163,7 +164,7 @@ class TestCodeDiffToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Test with invalid JSON - should handle gracefully
         result = asyncio.run(
@@ -203,7 +204,7 @@ class TestCodeDiffToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Should return an error response when no project is set
         result = asyncio.run(tool_func(duration=5.0, lines="[]"))
@@ -227,7 +228,7 @@ class TestCodeDiffToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_code_diff to raise exception
         with patch.object(timeline, "add_code_diff", side_effect=Exception("Test error")):
@@ -2,23 +2,37 @@
 Shared fixtures for component template tests.
 """
 
+import json
+from dataclasses import dataclass, field
+
 import pytest
 
 from chuk_motion.components import register_all_builders
 from chuk_motion.generator.component_builder import ComponentBuilder
-from chuk_motion.generator.composition_builder import CompositionBuilder
+from chuk_motion.generator.composition_builder import ComponentInstance, CompositionBuilder
 from chuk_motion.generator.timeline import Timeline
 from chuk_motion.themes.youtube_themes import YOUTUBE_THEMES
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional test dependency
+    from json import loads as _json_loads
+
 # Register all builder methods on both CompositionBuilder and Timeline
 # This ensures component tools work with either class in tests
 register_all_builders(CompositionBuilder)
 register_all_builders(Timeline)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def component_builder():
-    """Create a ComponentBuilder instance."""
+    """
+    Shared ComponentBuilder instance.
+
+    The builder only holds the Jinja2 environment and its template cache, so
+    one instance is reused for the whole session instead of reloading
+    templates for every test.
+    """
     return ComponentBuilder()
 
 
@@ -29,6 +43,62 @@ def composition_builder():
 
 
 @pytest.fixture
+def timeline():
+    """Create a fresh 30fps Timeline with all component methods registered."""
+    return Timeline(fps=30)
+
+
+@pytest.fixture(scope="session")
+def _tsx_memo():
+    """Generated TSX for the session, keyed by (component, theme, canonical config)."""
+    return {}
+
+
+@pytest.fixture
+def cached_build(component_builder, _tsx_memo):
+    """
+    Build a component TSX, generating each (component, theme, config) once.
+
+    Output is memoized for the session, so tests that render the same
+    component and theme share one build.
+    """
+
+    def _build(component_name: str, config: dict, theme_name: str = "tech") -> str:
+        memo_key = (component_name, theme_name, json.dumps(config, sort_keys=True, default=str))
+        tsx = _tsx_memo.get(memo_key)
+        if tsx is None:
+            tsx = component_builder.build_component(component_name, config, theme_name)
+            _tsx_memo[memo_key] = tsx
+        return tsx
+
+    return _build
+
+
+@dataclass(frozen=True, slots=True)
+class StubBuilder:
+    """
+    Minimal stand-in for CompositionBuilder in add_to_composition tests.
+
+    Builder functions only touch fps, components and seconds_to_frames, so
+    tests that just inspect the appended ComponentInstance can skip the
+    real builder.
+    """
+
+    fps: int = 30
+    components: list[ComponentInstance] = field(default_factory=list)
+
+    def seconds_to_frames(self, seconds: float) -> int:
+        """Convert seconds to frames."""
+        return int(seconds * self.fps)
+
+
+@pytest.fixture
+def stub_builder():
+    """Create a StubBuilder for builder method tests."""
+    return StubBuilder()
+
+
+@pytest.fixture(scope="session")
 def theme_name():
     """Default theme for testing."""
     return "tech"
@@ -46,6 +116,33 @@ def all_themes():
     return list(YOUTUBE_THEMES.keys())
 
 
+def parse_tool_result(result: str | bytes) -> dict:
+    """Parse the JSON string returned by an MCP component tool."""
+    return _json_loads(result)
+
+
+def extract_tool(mcp):
+    """Return the function a register_tool call passed to a Mock server's mcp.tool."""
+    return mcp.tool.call_args.args[0]
+
+
+def assert_tool_error(result: str | bytes, fragment: str = "") -> dict:
+    """Assert a tool returned an ErrorResponse whose message contains fragment."""
+    data = parse_tool_result(result)
+    assert "error" in data, f"Expected an error response, got {data}"
+    assert fragment in data["error"], f"{fragment!r} not in error {data['error']!r}"
+    return data
+
+
+def raising(message: str):
+    """Return a callable that raises Exception(message), for error-path tests."""
+
+    def _raise(*args, **kwargs):
+        raise Exception(message)
+
+    return _raise
+
+
 def assert_valid_typescript(tsx: str):
     """Common assertions for TypeScript validity."""
     # No unresolved template variables
@@ -64,6 +161,20 @@ def assert_valid_typescript(tsx: str):
     )
 
 
+def assert_valid_component(tsx: str, component_name: str):
+    """Assert a generated component is valid TypeScript with interface, timing and visibility."""
+    assert_valid_typescript(tsx)
+    assert_has_interface(tsx, component_name)
+    assert_has_timing_props(tsx)
+    assert_has_visibility_check(tsx)
+
+
+def assert_contains_all(tsx: str, tokens: tuple[str, ...]):
+    """Assert every token appears in the TSX."""
+    missing = [t for t in tokens if t not in tsx]
+    assert not missing, f"Missing expected tokens: {missing}"
+
+
 def assert_has_interface(tsx: str, component_name: str):
     """Assert component has proper TypeScript interface."""
     assert f"interface {component_name}Props" in tsx, f"Missing {component_name}Props interface"
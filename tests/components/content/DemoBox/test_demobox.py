@@ -5,6 +5,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -100,7 +101,7 @@ class TestDemoBoxToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Execute with all parameters
         result = asyncio.run(tool_func(label="Test Label", color="primary", duration=5.0))
@@ -128,7 +129,7 @@ class TestDemoBoxToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(label="Test"))
         result_data = json.loads(result)
@@ -150,7 +151,7 @@ class TestDemoBoxToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Patch add_demo_box to raise exception
         with patch.object(timeline, "add_demo_box", side_effect=Exception("Test error")):
@@ -10,6 +10,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -169,7 +170,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
 
@@ -191,7 +192,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(
             tool_func(
@@ -228,7 +229,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(sidebar_items=None))
 
@@ -252,7 +253,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(content_lines=None))
 
@@ -280,7 +281,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         custom_sidebar = ["Custom 1", "Custom 2"]
         custom_content = ["Line A", "Line B"]
@@ -309,7 +310,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(theme=theme))
 
@@ -329,7 +330,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(accent_color=accent_color))
 
@@ -347,7 +348,7 @@ class TestStylizedWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
         result_data = json.loads(result)
@@ -368,7 +369,7 @@ class TestStylizedWebPageToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Patch add_stylized_web_page to raise exception
         with patch.object(timeline, "add_stylized_web_page", side_effect=Exception("Test error")):
@@ -10,6 +10,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -128,7 +129,7 @@ class TestWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
 
@@ -150,7 +151,7 @@ class TestWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         html = "<header><h1>My Page</h1></header>"
         css = "h1 { color: blue; }"
@@ -199,7 +200,7 @@ class TestWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
 
@@ -231,7 +232,7 @@ class TestWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(theme=theme))
 
@@ -250,7 +251,7 @@ class TestWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(scroll_y=500, animate_scroll=True, scroll_duration=180))
 
@@ -276,7 +277,7 @@ class TestWebPageToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
         result_data = json.loads(result)
@@ -297,7 +298,7 @@ class TestWebPageToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Patch add_web_page to raise exception
         with patch.object(timeline, "add_web_page", side_effect=Exception("Test error")):
@@ -5,6 +5,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -122,7 +123,7 @@ class TestBrowserFrameToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Execute with all parameters
         tabs = json.dumps([{"title": "Tab 1", "url": "https://example.com"}])
@@ -171,7 +172,7 @@ class TestBrowserFrameToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Test with invalid JSON - should handle gracefully
         result = asyncio.run(
@@ -212,7 +213,7 @@ class TestBrowserFrameToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Should return an error response when no project is set
         result = asyncio.run(tool_func(duration=5.0))
@@ -240,7 +241,7 @@ class TestBrowserFrameToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(duration=5.0, url="https://example.com"))
 
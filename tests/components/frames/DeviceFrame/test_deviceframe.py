@@ -5,6 +5,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -109,7 +110,7 @@ class TestDeviceFrameToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Execute with all parameters
         result = asyncio.run(
@@ -153,7 +154,7 @@ class TestDeviceFrameToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Should return an error response when no project is set
         result = asyncio.run(tool_func(duration=5.0))
@@ -181,7 +182,7 @@ class TestDeviceFrameToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func(duration=5.0, device="phone"))
 
@@ -5,6 +5,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -116,7 +117,7 @@ class TestTerminalToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Execute with all parameters
         commands = json.dumps([{"command": "ls", "output": "file.txt"}])
@@ -165,7 +166,7 @@ class TestTerminalToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Test with invalid JSON - should handle gracefully
         result = asyncio.run(
@@ -206,7 +207,7 @@ class TestTerminalToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Should return an error response when no project is set
         result = asyncio.run(tool_func(duration=5.0))
@@ -234,7 +235,7 @@ class TestTerminalToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Call tool which should catch the exception
         result = asyncio.run(tool_func(duration=5.0))
@@ -5,6 +5,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -110,7 +111,7 @@ class TestAsymmetricLayoutToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
 
@@ -135,7 +136,7 @@ class TestAsymmetricLayoutToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
         result_data = json.loads(result)
@@ -157,7 +158,7 @@ class TestAsymmetricLayoutToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         with patch.object(builder, "add_asymmetric_layout", side_effect=Exception("Test error")):
             result = asyncio.run(tool_func())
@@ -180,7 +181,7 @@ class TestAsymmetricLayoutToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Test with invalid JSON
         result = asyncio.run(tool_func(main="invalid json {"))
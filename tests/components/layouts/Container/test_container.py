@@ -1,4 +1,4 @@
-# chuk-motion/src/chuk_motion/components/layouts/Container/test_container.py
+# chuk-motion/tests/components/layouts/Container/test_container.py
 """
 Tests for Container template generation.
 """
@@ -8,6 +8,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -115,7 +116,7 @@ class TestContainerToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(duration=5.0))
 
@@ -137,7 +138,7 @@ class TestContainerToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(duration=5.0))
 
@@ -160,7 +161,7 @@ class TestContainerToolRegistration:
         project_manager.current_timeline = builder
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_container to raise exception
         with patch.object(builder, "add_container", side_effect=Exception("Test error")):
@@ -185,7 +186,7 @@ class TestContainerToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Test with invalid JSON content
         result = asyncio.run(tool_func(content="invalid json", duration=5.0))
@@ -1,50 +1,45 @@
 """Tests for FocusStrip template generation."""
 
+import pytest
 from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
+    assert_tool_error,
+    assert_valid_component,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.layouts.FocusStrip.builder import add_to_composition
+from chuk_motion.components.layouts.FocusStrip.tool import register_tool
+
+pytestmark = pytest.mark.xdist_group("layouts_focusstrip")
+
 
 class TestFocusStripBasic:
     """Basic FocusStrip generation tests."""
 
-    def test_basic_generation(self, component_builder, theme_name):
+    def test_basic_generation(self, cached_build, theme_name):
         """Test basic FocusStrip generation."""
-        tsx = component_builder.build_component("FocusStrip", {}, theme_name)
+        tsx = cached_build("FocusStrip", {}, theme_name)
         assert tsx is not None
         assert "FocusStrip" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "FocusStrip")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
+        assert_valid_component(tsx, "FocusStrip")
 
 
 class TestFocusStripBuilderMethod:
     """Tests for FocusStrip builder method."""
 
-    def test_add_to_composition_basic(self):
+    def test_add_to_composition_basic(self, stub_builder):
         """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.layouts.FocusStrip.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, start_time=0.0)
+        result = add_to_composition(stub_builder, start_time=0.0)
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "FocusStrip"
+        assert result is stub_builder
+        assert len(stub_builder.components) == 1
+        assert stub_builder.components[0].component_type == "FocusStrip"
 
-    def test_add_to_composition_all_props(self):
+    def test_add_to_composition_all_props(self, stub_builder):
         """Test all props are set correctly."""
-        from chuk_motion.components.layouts.FocusStrip.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
         add_to_composition(
-            builder,
+            stub_builder,
             start_time=1.0,
             main_content={"type": "main"},
             focus_content={"type": "focus"},
@@ -55,7 +50,7 @@ class TestFocusStripBuilderMethod:
             duration=10.0,
         )
 
-        props = builder.components[0].props
+        props = stub_builder.components[0].props
         assert props["main_content"] == {"type": "main"}
         assert props["focus_content"] == {"type": "focus"}
         assert props["position"] == "bottom"
@@ -63,15 +58,11 @@ class TestFocusStripBuilderMethod:
         assert props["gap"] == 25.0
         assert props["padding"] == 50.0
 
-    def test_add_to_composition_timing(self):
+    def test_add_to_composition_timing(self, stub_builder):
         """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.layouts.FocusStrip.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, start_time=2.0, duration=5.0)
+        add_to_composition(stub_builder, start_time=2.0, duration=5.0)
 
-        component = builder.components[0]
+        component = stub_builder.components[0]
         assert component.start_frame == 60  # 2.0 * 30fps
         assert component.duration_frames == 150  # 5.0 * 30fps
 
@@ -79,109 +70,47 @@ class TestFocusStripBuilderMethod:
 class TestFocusStripToolRegistration:
     """Tests for FocusStrip MCP tool registration."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, composition_builder):
+        """Register the tool against a fresh CompositionBuilder and return (tool_func, builder)."""
+        project_manager.current_timeline = composition_builder
 
-        from chuk_motion.components.layouts.FocusStrip.tool import register_tool
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_focus_strip"], composition_builder
 
-        mcp_mock = Mock()
-        pm_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
+    def test_register_tool(self, mock_mcp_server, project_manager):
+        """Test tool registration."""
+        register_tool(mock_mcp_server, project_manager)
 
-        mcp_mock.tool.assert_called_once()
+        assert list(mock_mcp_server.tools) == ["remotion_add_focus_strip"]
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.FocusStrip.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
+        tool_func, builder = registered_tool
 
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
+        result = await tool_func()
 
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "FocusStrip"
 
         # Verify component was added
         assert len(builder.components) >= 1
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution without active project."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.FocusStrip.tool import register_tool
-
-        # Mock ProjectManager with no current_timeline
-        pm_mock = Mock()
-        pm_mock.current_timeline = None
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-        result_data = json.loads(result)
-        assert "error" in result_data
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool handles errors gracefully."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.FocusStrip.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
+        tool_func, builder = registered_tool
 
-        # Mock ProjectManager with builder that raises an error
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
+        builder.add_focus_strip = raising("Test error")
+        result = await tool_func()
+        assert_tool_error(result, "Test error")
 
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        with patch.object(builder, "add_focus_strip", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func())
-            result_data = json.loads(result)
-            assert "error" in result_data
-
-    def test_tool_json_parsing_error(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_json_parsing_error(self, registered_tool):
         """Test tool handles JSON parsing errors."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.FocusStrip.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, _ = registered_tool
 
         # Test with invalid JSON
-        result = asyncio.run(tool_func(main_content="invalid json {"))
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Invalid component JSON" in result_data["error"]
+        result = await tool_func(main_content="invalid json {")
+        assert_tool_error(result, "Invalid component JSON")
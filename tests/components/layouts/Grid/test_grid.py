@@ -1,36 +1,40 @@
-# chuk-motion/src/chuk_motion/components/layouts/Grid/test_grid.py
+# chuk-motion/tests/components/layouts/Grid/test_grid.py
 """
 Tests for Grid layout template generation.
 """
 
+from unittest.mock import patch
+
 import pytest
 from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
+    assert_tool_error,
+    assert_valid_component,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.layouts.Grid.builder import add_to_composition
+from chuk_motion.components.layouts.Grid.tool import register_tool
+
+pytestmark = pytest.mark.xdist_group("layouts_grid")
+
 
 class TestGridBasic:
     """Basic Grid generation tests."""
 
-    def test_basic_generation(self, component_builder, theme_name):
+    def test_basic_generation(self, cached_build, theme_name):
         """Test basic Grid generation with all props."""
-        tsx = component_builder.build_component(
+        tsx = cached_build(
             "Grid", {"layout": "2x2", "padding": 40, "gap": 30, "border_width": 3}, theme_name
         )
 
         assert tsx is not None
         assert "Grid" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "Grid")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
+        assert_valid_component(tsx, "Grid")
 
-    def test_minimal_props(self, component_builder, theme_name):
+    def test_minimal_props(self, cached_build, theme_name):
         """Test Grid with minimal props."""
-        tsx = component_builder.build_component("Grid", {}, theme_name)
+        tsx = cached_build("Grid", {}, theme_name)
 
         assert tsx is not None
         # Should have defaults
@@ -42,18 +46,18 @@ class TestGridLayouts:
     """Tests for Grid layout variants."""
 
     @pytest.mark.parametrize("layout", ["1x2", "2x1", "2x2", "3x2", "2x3", "3x3", "4x2", "2x4"])
-    def test_layout_variant(self, component_builder, theme_name, layout):
+    def test_layout_variant(self, cached_build, theme_name, layout):
         """Test each layout variant generates correctly."""
-        tsx = component_builder.build_component("Grid", {"layout": layout}, theme_name)
+        tsx = cached_build("Grid", {"layout": layout}, theme_name)
 
         assert tsx is not None
         assert layout in tsx
         assert "gridTemplateColumns" in tsx
         assert "gridTemplateRows" in tsx
 
-    def test_layout_mapping(self, component_builder, theme_name):
+    def test_layout_mapping(self, cached_build, theme_name):
         """Test that layouts map to correct grid templates."""
-        tsx = component_builder.build_component("Grid", {"layout": "2x2"}, theme_name)
+        tsx = cached_build("Grid", {"layout": "2x2"}, theme_name)
 
         # Should define layout configuration
         assert "2x2" in tsx
@@ -63,23 +67,23 @@ class TestGridLayouts:
 class TestGridProps:
     """Tests for Grid runtime props."""
 
-    def test_padding_prop(self, component_builder, theme_name):
+    def test_padding_prop(self, cached_build, theme_name):
         """Test padding prop is used."""
-        tsx = component_builder.build_component("Grid", {"padding": 60}, theme_name)
+        tsx = cached_build("Grid", {"padding": 60}, theme_name)
 
         assert "padding" in tsx
         assert "padding = 40" in tsx or "padding = " in tsx  # Has default
 
-    def test_gap_prop(self, component_builder, theme_name):
+    def test_gap_prop(self, cached_build, theme_name):
         """Test gap prop is used."""
-        tsx = component_builder.build_component("Grid", {"gap": 25}, theme_name)
+        tsx = cached_build("Grid", {"gap": 25}, theme_name)
 
         assert "gap" in tsx
         assert "gap = 20" in tsx or "gap = " in tsx  # Has default
 
-    def test_border_props(self, component_builder, theme_name):
+    def test_border_props(self, cached_build, theme_name):
         """Test border props are used."""
-        tsx = component_builder.build_component(
+        tsx = cached_build(
             "Grid", {"border_width": 2, "border_color": "rgba(255, 255, 255, 0.2)"}, theme_name
         )
 
@@ -87,11 +91,9 @@ class TestGridProps:
         assert "border_color" in tsx
         assert "border_radius" in tsx
 
-    def test_cell_background_prop(self, component_builder, theme_name):
+    def test_cell_background_prop(self, cached_build, theme_name):
         """Test cell_background prop is used."""
-        tsx = component_builder.build_component(
-            "Grid", {"cell_background": "rgba(0, 0, 0, 0.3)"}, theme_name
-        )
+        tsx = cached_build("Grid", {"cell_background": "rgba(0, 0, 0, 0.3)"}, theme_name)
 
         assert "cell_background" in tsx
 
@@ -99,17 +101,17 @@ class TestGridProps:
 class TestGridChildren:
     """Tests for Grid children rendering."""
 
-    def test_children_array_handling(self, component_builder, theme_name):
+    def test_children_array_handling(self, cached_build, theme_name):
         """Test Grid handles children array."""
-        tsx = component_builder.build_component("Grid", {}, theme_name)
+        tsx = cached_build("Grid", {}, theme_name)
 
         assert "children" in tsx
         assert "Array.isArray" in tsx
         assert "children.map" in tsx
 
-    def test_cell_wrapper(self, component_builder, theme_name):
+    def test_cell_wrapper(self, cached_build, theme_name):
         """Test each cell is wrapped with styling div."""
-        tsx = component_builder.build_component("Grid", {}, theme_name)
+        tsx = cached_build("Grid", {}, theme_name)
 
         # Each child should be wrapped
         assert "width: " in tsx
@@ -120,17 +122,17 @@ class TestGridChildren:
 class TestGridStyling:
     """Tests for Grid CSS styling."""
 
-    def test_absolute_positioning(self, component_builder, theme_name):
+    def test_absolute_positioning(self, cached_build, theme_name):
         """Test Grid uses absolute positioning."""
-        tsx = component_builder.build_component("Grid", {}, theme_name)
+        tsx = cached_build("Grid", {}, theme_name)
 
         assert "position: " in tsx or "position: 'absolute'" in tsx
         assert "top" in tsx
         assert "left" in tsx
 
-    def test_grid_display(self, component_builder, theme_name):
+    def test_grid_display(self, cached_build, theme_name):
         """Test Grid uses CSS Grid."""
-        tsx = component_builder.build_component("Grid", {}, theme_name)
+        tsx = cached_build("Grid", {}, theme_name)
 
         assert "display: 'grid'" in tsx or "display: grid" in tsx
         assert "gridTemplateColumns" in tsx
@@ -140,46 +142,40 @@ class TestGridStyling:
 class TestGridBuilderMethod:
     """Tests for Grid builder method."""
 
-    def test_add_to_composition_basic(self):
+    def test_add_to_composition_basic(self, stub_builder):
         """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.layouts.Grid.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
         items = ["item1", "item2"]
-        result = add_to_composition(builder, items=items, start_time=0.0)
+        result = add_to_composition(stub_builder, items=items, start_time=0.0)
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "Grid"
-        assert builder.components[0].props["items"] == items
+        assert result is stub_builder
+        assert len(stub_builder.components) == 1
+        assert stub_builder.components[0].component_type == "Grid"
+        assert stub_builder.components[0].props["items"] == items
 
-    def test_add_to_composition_all_props(self):
+    def test_add_to_composition_all_props(self, stub_builder):
         """Test all props are set correctly."""
-        from chuk_motion.components.layouts.Grid.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
         items = ["item1", "item2", "item3"]
         add_to_composition(
-            builder, items=items, start_time=1.0, layout="2x2", gap=30, padding=60, duration=10.0
+            stub_builder,
+            items=items,
+            start_time=1.0,
+            layout="2x2",
+            gap=30,
+            padding=60,
+            duration=10.0,
         )
 
-        props = builder.components[0].props
+        props = stub_builder.components[0].props
         assert props["items"] == items
         assert props["layout"] == "2x2"
         assert props["gap"] == 30
         assert props["padding"] == 60
 
-    def test_add_to_composition_timing(self):
+    def test_add_to_composition_timing(self, stub_builder):
         """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.layouts.Grid.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, items=[], start_time=2.0, duration=5.0)
+        add_to_composition(stub_builder, items=[], start_time=2.0, duration=5.0)
 
-        component = builder.components[0]
+        component = stub_builder.components[0]
         assert component.start_frame == 60
         assert component.duration_frames == 150
 
@@ -187,159 +183,75 @@ class TestGridBuilderMethod:
 class TestGridToolRegistration:
     """Tests for Grid MCP tool."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Grid.tool import register_tool
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        mcp = Mock()
-        project_manager = Mock()
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_grid"], timeline
 
-        register_tool(mcp, project_manager)
+    def test_register_tool(self, mock_mcp_server, project_manager):
+        """Test tool registration."""
+        register_tool(mock_mcp_server, project_manager)
 
-        assert mcp.tool.called or hasattr(mcp, "tool")
+        assert list(mock_mcp_server.tools) == ["remotion_add_grid"]
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution creates component."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Grid.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
+        tool_func, timeline = registered_tool
 
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(items='[{"title": "A"}]', duration=5.0))
+        result = await tool_func(items='[{"title": "A"}]', duration=5.0)
 
         # Check component was added
         assert len(timeline.get_all_components()) >= 1
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Grid"
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution when no project exists."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Grid.tool import register_tool
-
-        mcp = Mock()
-        project_manager = Mock()
-        project_manager.current_timeline = None  # No project
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(items='[{"title": "A"}]', duration=5.0))
-
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "No active project" in result_data["error"]
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool execution handles exceptions."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.Grid.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        mcp = Mock()
-        project_manager = Mock()
-        builder = CompositionBuilder(fps=30)
-        project_manager.current_timeline = builder
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
         # Mock add_grid to raise exception
-        with patch.object(builder, "add_grid", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func(items='[{"title": "A"}]', duration=5.0))
+        timeline.add_grid = raising("Test error")
+        result = await tool_func(items='[{"title": "A"}]', duration=5.0)
 
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Test error" in result_data["error"]
+        assert_tool_error(result, "Test error")
 
-    def test_tool_execution_invalid_json(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_invalid_json(self, registered_tool):
         """Test tool execution handles invalid JSON data."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Grid.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
+        tool_func, _ = registered_tool
 
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        result = await tool_func(items="invalid json {[}", duration=4.0)
 
-        result = asyncio.run(tool_func(items="invalid json {[}", duration=4.0))
+        assert_tool_error(result, "Invalid items JSON")
 
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Invalid items JSON" in result_data["error"]
-
-    def test_tool_execution_non_list_items(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_non_list_items(self, registered_tool):
         """Test tool execution when items is not a list."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Grid.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func, _ = registered_tool
 
         # Test with dict instead of list - should still work but skip the list processing
-        result = asyncio.run(tool_func(items='{"title": "A"}', duration=5.0))
+        result = await tool_func(items='{"title": "A"}', duration=5.0)
 
         # Should succeed but with empty children
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Grid"
 
-    def test_tool_execution_with_null_child(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_with_null_child(self, registered_tool):
         """Test tool execution when parse_nested_component returns None."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.Grid.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func, _ = registered_tool
 
         # Mock parse_nested_component to return None
         with patch(
             "chuk_motion.components.layouts.Grid.tool.parse_nested_component", return_value=None
         ):
-            result = asyncio.run(tool_func(items='[{"title": "A"}]', duration=5.0))
+            result = await tool_func(items='[{"title": "A"}]', duration=5.0)
 
         # Should still succeed, just with no children added
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Grid"
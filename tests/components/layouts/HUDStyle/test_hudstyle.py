@@ -1,50 +1,45 @@
 """Tests for HUDStyle template generation."""
 
+import pytest
 from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
+    assert_tool_error,
+    assert_valid_component,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.layouts.HUDStyle.builder import add_to_composition
+from chuk_motion.components.layouts.HUDStyle.tool import register_tool
+
+pytestmark = pytest.mark.xdist_group("layouts_hudstyle")
+
 
 class TestHUDStyleBasic:
     """Basic HUDStyle generation tests."""
 
-    def test_basic_generation(self, component_builder, theme_name):
+    def test_basic_generation(self, cached_build, theme_name):
         """Test basic HUDStyle generation."""
-        tsx = component_builder.build_component("HUDStyle", {}, theme_name)
+        tsx = cached_build("HUDStyle", {}, theme_name)
         assert tsx is not None
         assert "HUDStyle" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "HUDStyle")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
+        assert_valid_component(tsx, "HUDStyle")
 
 
 class TestHUDStyleBuilderMethod:
     """Tests for HUDStyle builder method."""
 
-    def test_add_to_composition_basic(self):
+    def test_add_to_composition_basic(self, stub_builder):
         """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.layouts.HUDStyle.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, start_time=0.0)
+        result = add_to_composition(stub_builder, start_time=0.0)
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "HUDStyle"
+        assert result is stub_builder
+        assert len(stub_builder.components) == 1
+        assert stub_builder.components[0].component_type == "HUDStyle"
 
-    def test_add_to_composition_all_props(self):
+    def test_add_to_composition_all_props(self, stub_builder):
         """Test all props are set correctly."""
-        from chuk_motion.components.layouts.HUDStyle.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
         add_to_composition(
-            builder,
+            stub_builder,
             start_time=1.0,
             main_content={"type": "main"},
             top_left={"type": "tl"},
@@ -58,7 +53,7 @@ class TestHUDStyleBuilderMethod:
             duration=10.0,
         )
 
-        props = builder.components[0].props
+        props = stub_builder.components[0].props
         assert props["main_content"] == {"type": "main"}
         assert props["top_left"] == {"type": "tl"}
         assert props["top_right"] == {"type": "tr"}
@@ -69,15 +64,11 @@ class TestHUDStyleBuilderMethod:
         assert props["gap"] == 25.0
         assert props["padding"] == 50.0
 
-    def test_add_to_composition_timing(self):
+    def test_add_to_composition_timing(self, stub_builder):
         """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.layouts.HUDStyle.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, start_time=2.0, duration=5.0)
+        add_to_composition(stub_builder, start_time=2.0, duration=5.0)
 
-        component = builder.components[0]
+        component = stub_builder.components[0]
         assert component.start_frame == 60
         assert component.duration_frames == 150
 
@@ -85,109 +76,47 @@ class TestHUDStyleBuilderMethod:
 class TestHUDStyleToolRegistration:
     """Tests for HUDStyle MCP tool registration."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        from chuk_motion.components.layouts.HUDStyle.tool import register_tool
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_hud_style"], timeline
 
-        mcp_mock = Mock()
-        pm_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
+    def test_register_tool(self, mock_mcp_server, project_manager):
+        """Test tool registration."""
+        register_tool(mock_mcp_server, project_manager)
 
-        mcp_mock.tool.assert_called_once()
+        assert list(mock_mcp_server.tools) == ["remotion_add_hud_style"]
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.HUDStyle.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
+        tool_func, timeline = registered_tool
 
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
+        result = await tool_func()
 
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "HUDStyle"
 
         # Verify component was added
         assert len(timeline.get_all_components()) >= 1
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution without active project."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.HUDStyle.tool import register_tool
-
-        # Mock ProjectManager with no current_timeline
-        pm_mock = Mock()
-        pm_mock.current_timeline = None
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-        result_data = json.loads(result)
-        assert "error" in result_data
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool handles errors gracefully."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.HUDStyle.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
+        tool_func, timeline = registered_tool
 
-        # Mock ProjectManager with timeline that raises an error
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
+        timeline.add_hud_style = raising("Test error")
+        result = await tool_func()
+        assert_tool_error(result, "Test error")
 
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        with patch.object(timeline, "add_hud_style", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func())
-            result_data = json.loads(result)
-            assert "error" in result_data
-
-    def test_tool_json_parsing_error(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_json_parsing_error(self, registered_tool):
         """Test tool handles JSON parsing errors."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.HUDStyle.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, _ = registered_tool
 
         # Test with invalid JSON
-        result = asyncio.run(tool_func(main_content="invalid json {"))
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Invalid" in result_data["error"]
+        result = await tool_func(main_content="invalid json {")
+        assert_tool_error(result, "Invalid")
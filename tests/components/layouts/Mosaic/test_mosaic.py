@@ -1,244 +1,87 @@
-"""Tests for Mosaic template generation."""
+"""Tests for the Mosaic MCP tool.
 
-from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
-)
-
-
-class TestMosaicBasic:
-    """Basic Mosaic generation tests."""
-
-    def test_basic_generation(self, component_builder, theme_name):
-        """Test basic Mosaic generation."""
-        tsx = component_builder.build_component("Mosaic", {}, theme_name)
-        assert tsx is not None
-        assert "Mosaic" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "Mosaic")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
-
-
-class TestMosaicBuilderMethod:
-    """Tests for Mosaic builder method."""
-
-    def test_add_to_composition_basic(self):
-        """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.layouts.Mosaic.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, start_time=0.0)
+Generation, builder and registration tests shared with the other layouts
+live in tests/components/layouts/test_layouts_shared.py.
+"""
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "Mosaic"
+import json
 
-    def test_add_to_composition_all_props(self):
-        """Test all props are set correctly."""
-        from chuk_motion.components.layouts.Mosaic.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        test_clips = [{"id": "clip1"}, {"id": "clip2"}]
-        add_to_composition(
-            builder,
-            start_time=1.0,
-            clips=test_clips,
-            style="grid",
-            gap=15.0,
-            padding=50.0,
-            duration=10.0,
-        )
-
-        props = builder.components[0].props
-        assert props["clips"] == test_clips
-        assert props["style"] == "grid"
-        assert props["gap"] == 15.0
-        assert props["padding"] == 50.0
+import pytest
+from tests.components.conftest import (
+    assert_tool_error,
+    parse_tool_result,
+    raising,
+)
 
-    def test_add_to_composition_timing(self):
-        """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.layouts.Mosaic.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
+from chuk_motion.components.layouts.Mosaic.tool import register_tool
 
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, start_time=2.0, duration=5.0)
+pytestmark = pytest.mark.xdist_group("layouts_mosaic")
 
-        component = builder.components[0]
-        assert component.start_frame == 60
-        assert component.duration_frames == 150
+# Tool arguments arrive as JSON strings; encode the fixed inputs once at import.
+CLIPS_DICT_JSON = json.dumps({"not": "a list"})
+# Items without a "type" (and null) will not become ComponentInstances
+CLIPS_MIXED_JSON = json.dumps(
+    [
+        {"type": "CodeBlock", "config": {"code": "Valid"}},
+        {"config": {"code": "Invalid - no type"}},
+        None,
+    ]
+)
 
 
 class TestMosaicToolRegistration:
     """Tests for Mosaic MCP tool registration."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Mosaic.tool import register_tool
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the Mosaic tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        mcp_mock = Mock()
-        pm_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_mosaic"], timeline
 
-        mcp_mock.tool.assert_called_once()
-
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Mosaic.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
+        tool_func, timeline = registered_tool
 
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
+        result = await tool_func()
 
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Mosaic"
 
         # Verify component was added
         assert len(timeline.get_all_components()) >= 1
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution without active project."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Mosaic.tool import register_tool
-
-        # Mock ProjectManager with no current_timeline
-        pm_mock = Mock()
-        pm_mock.current_timeline = None
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-        result_data = json.loads(result)
-        assert "error" in result_data
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool handles errors gracefully."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.Mosaic.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Mock ProjectManager with timeline that raises an error
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        with patch.object(timeline, "add_mosaic", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func())
-            result_data = json.loads(result)
-            assert "error" in result_data
-
-    def test_tool_json_parsing_error(self):
-        """Test tool handles JSON parsing errors."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Mosaic.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        # Test with invalid JSON
-        result = asyncio.run(tool_func(clips="invalid json {"))
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Invalid" in result_data["error"]
-
-    def test_tool_execution_clips_not_list(self):
-        """Test tool execution when clips is not a list."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Mosaic.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
+        tool_func, timeline = registered_tool
 
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
+        timeline.add_mosaic = raising("Test error")
+        result = await tool_func()
+        assert_tool_error(result, "Test error")
 
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_clips_not_list(self, registered_tool):
+        """Test tool execution when clips is not a list."""
+        tool_func, timeline = registered_tool
 
         # Test with clips as a dict, not a list
-        clips_json = json.dumps({"not": "a list"})
-
-        result = asyncio.run(tool_func(clips=clips_json))
+        result = await tool_func(clips=CLIPS_DICT_JSON)
 
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Mosaic"
         assert len(timeline.get_all_components()) >= 1
 
-    def test_tool_execution_clips_with_none_items(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_clips_with_none_items(self, registered_tool):
         """Test tool execution when some clip items parse to None."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Mosaic.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
         # Test with clips that include items without 'type' (will parse to non-ComponentInstance)
-        clips_json = json.dumps(
-            [
-                {"type": "CodeBlock", "config": {"code": "Valid"}},
-                {"config": {"code": "Invalid - no type"}},  # This won't become a ComponentInstance
-                None,  # This will also not become a ComponentInstance
-            ]
-        )
-
-        result = asyncio.run(tool_func(clips=clips_json))
+        result = await tool_func(clips=CLIPS_MIXED_JSON)
 
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Mosaic"
         assert len(timeline.get_all_components()) >= 1
@@ -5,6 +5,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -108,7 +109,7 @@ class TestOverTheShoulderToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
 
@@ -133,7 +134,7 @@ class TestOverTheShoulderToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(tool_func())
         result_data = json.loads(result)
@@ -155,7 +156,7 @@ class TestOverTheShoulderToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         with patch.object(timeline, "add_over_the_shoulder", side_effect=Exception("Test error")):
             result = asyncio.run(tool_func())
@@ -178,7 +179,7 @@ class TestOverTheShoulderToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Test with invalid JSON
         result = asyncio.run(tool_func(screen_content="invalid json {"))
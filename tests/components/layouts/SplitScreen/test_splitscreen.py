@@ -1,196 +1,61 @@
-# chuk-motion/src/chuk_motion/components/layouts/SplitScreen/test_splitscreen.py
+# chuk-motion/tests/components/layouts/SplitScreen/test_splitscreen.py
 """
 Tests for SplitScreen layout template generation.
 """
 
+import pytest
 from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
+    assert_contains_all,
+    assert_tool_error,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.layouts.SplitScreen.tool import register_tool
 
-class TestSplitScreenBasic:
-    """Basic SplitScreen generation tests."""
+pytestmark = pytest.mark.xdist_group("layouts_splitscreen")
 
-    def test_basic_generation(self, component_builder, theme_name):
-        """Test basic SplitScreen generation."""
-        tsx = component_builder.build_component("SplitScreen", {}, theme_name)
 
-        assert tsx is not None
-        assert "SplitScreen" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "SplitScreen")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
+class TestSplitScreenBasic:
+    """Basic SplitScreen generation tests."""
 
-    def test_named_props(self, component_builder, theme_name):
+    def test_named_props(self, cached_build, theme_name):
         """Test uses named props (left, right)."""
-        tsx = component_builder.build_component("SplitScreen", {}, theme_name)
-
-        assert "left" in tsx
-        assert "right" in tsx
-
-
-class TestSplitScreenBuilderMethod:
-    """Tests for SplitScreen builder method."""
-
-    def test_add_to_composition_basic(self):
-        """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.layouts.SplitScreen.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, start_time=0.0)
-
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "SplitScreen"
+        tsx = cached_build("SplitScreen", {}, theme_name)
 
-    def test_add_to_composition_all_props(self):
-        """Test all props are set correctly."""
-        from chuk_motion.components.layouts.SplitScreen.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        add_to_composition(
-            builder,
-            start_time=1.0,
-            orientation="horizontal",
-            layout="50-50",
-            gap=30,
-            left_content="left",
-            right_content="right",
-            duration=10.0,
-        )
-
-        props = builder.components[0].props
-        assert props["orientation"] == "horizontal"
-        assert props["layout"] == "50-50"
-        assert props["gap"] == 30
-        assert props["left_content"] == "left"
-        assert props["right_content"] == "right"
-
-    def test_add_to_composition_timing(self):
-        """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.layouts.SplitScreen.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, start_time=2.0, duration=5.0)
-
-        component = builder.components[0]
-        assert component.start_frame == 60
-        assert component.duration_frames == 150
+        assert_contains_all(tsx, ("left", "right"))
 
 
 class TestSplitScreenToolRegistration:
     """Tests for SplitScreen MCP tool."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.SplitScreen.tool import register_tool
-
-        mcp = Mock()
-        project_manager = Mock()
-
-        register_tool(mcp, project_manager)
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        assert mcp.tool.called or hasattr(mcp, "tool")
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_split_screen"], timeline
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution creates component."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.SplitScreen.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
+        tool_func, timeline = registered_tool
 
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(duration=5.0))
+        result = await tool_func(duration=5.0)
 
         # Check component was added
         assert len(timeline.get_all_components()) >= 1
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "SplitScreen"
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution when no project exists."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.SplitScreen.tool import register_tool
-
-        mcp = Mock()
-        project_manager = Mock()
-        project_manager.current_timeline = None  # No project
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(duration=5.0))
-
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "No active project" in result_data["error"]
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool execution handles exceptions."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.SplitScreen.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
         # Mock add_split_screen to raise exception
-        with patch.object(timeline, "add_split_screen", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func(duration=5.0))
-
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Test error" in result_data["error"]
-
-    def test_tool_json_parsing_error(self):
-        """Test tool handles invalid JSON in component parameters."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.SplitScreen.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        # Test with invalid JSON in left_content parameter
-        result = asyncio.run(tool_func(left_content="invalid json", duration=5.0))
+        timeline.add_split_screen = raising("Test error")
+        result = await tool_func(duration=5.0)
 
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Invalid component JSON" in result_data["error"]
+        assert_tool_error(result, "Test error")
@@ -1,163 +1,47 @@
-"""Tests for Timeline template generation."""
+"""Tests for the Timeline MCP tool.
 
-from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
-)
+Generation, builder and registration tests shared with the other layouts
+live in tests/components/layouts/test_layouts_shared.py.
+"""
 
+import json
 
-class TestTimelineBasic:
-    """Basic Timeline generation tests."""
+import pytest
+from tests.components.conftest import assert_tool_error, parse_tool_result, raising
 
-    def test_basic_generation(self, component_builder, theme_name):
-        """Test basic Timeline generation."""
-        tsx = component_builder.build_component("Timeline", {}, theme_name)
-        assert tsx is not None
-        assert "Timeline" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "Timeline")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
+from chuk_motion.components.layouts.Timeline.tool import register_tool
 
-
-class TestTimelineBuilderMethod:
-    """Tests for Timeline builder method."""
-
-    def test_add_to_composition_basic(self):
-        """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.layouts.Timeline.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, start_time=0.0)
-
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "Timeline"
-
-    def test_add_to_composition_all_props(self):
-        """Test all props are set correctly."""
-        from chuk_motion.components.layouts.Timeline.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        test_milestones = [{"time": 1.0, "label": "Event 1"}]
-        add_to_composition(
-            builder,
-            start_time=1.0,
-            main_content={"type": "main"},
-            milestones=test_milestones,
-            current_time=5.0,
-            total_duration=15.0,
-            position="top",
-            height=120.0,
-            duration=10.0,
-        )
-
-        props = builder.components[0].props
-        assert props["main_content"] == {"type": "main"}
-        assert props["milestones"] == test_milestones
-        assert props["current_time"] == 5.0
-        assert props["total_duration"] == 15.0
-        assert props["position"] == "top"
-        assert props["height"] == 120.0
-
-    def test_add_to_composition_timing(self):
-        """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.layouts.Timeline.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, start_time=2.0, duration=5.0)
-
-        component = builder.components[0]
-        assert component.start_frame == 60
-        assert component.duration_frames == 150
+pytestmark = pytest.mark.xdist_group("layouts_timeline")
 
 
 class TestTimelineToolRegistration:
     """Tests for Timeline MCP tool registration."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, composition_builder):
+        """Register the tool against a fresh CompositionBuilder and return (tool_func, builder)."""
+        project_manager.current_timeline = composition_builder
 
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_timeline"], composition_builder
 
-        mcp_mock = Mock()
-        pm_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        mcp_mock.tool.assert_called_once()
-
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
+        tool_func, builder = registered_tool
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        result = await tool_func()
 
-        result = asyncio.run(tool_func())
-
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Timeline"
 
         # Verify component was added
         assert len(builder.components) >= 1
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution without active project."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
-
-        # Mock ProjectManager with no current_timeline
-        pm_mock = Mock()
-        pm_mock.current_timeline = None
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-        result_data = json.loads(result)
-        assert "error" in result_data
-
-    def test_tool_execution_with_milestones(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_with_milestones(self, registered_tool):
         """Test tool execution with milestones containing nested components."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, builder = registered_tool
 
         # Test with milestones as JSON array with nested components
         milestones_json = json.dumps(
@@ -167,105 +51,41 @@ class TestTimelineToolRegistration:
             ]
         )
 
-        result = asyncio.run(tool_func(milestones=milestones_json))
+        result = await tool_func(milestones=milestones_json)
 
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Timeline"
 
         # Verify component was added
         assert len(builder.components) >= 1
 
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool handles errors gracefully."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with builder that raises an error
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        with patch.object(builder, "add_timeline", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func())
-            result_data = json.loads(result)
-            assert "error" in result_data
+        tool_func, builder = registered_tool
 
-    def test_tool_json_parsing_error(self):
-        """Test tool handles JSON parsing errors."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
+        builder.add_timeline = raising("Test error")
+        result = await tool_func()
+        assert_tool_error(result, "Test error")
 
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        # Test with invalid JSON
-        result = asyncio.run(tool_func(main_content="invalid json {"))
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Invalid" in result_data["error"]
-
-    def test_tool_execution_with_invalid_milestone_format(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_with_invalid_milestone_format(self, registered_tool):
         """Test tool execution when milestones is not a list."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, builder = registered_tool
 
         # Test with milestones as a non-list (e.g., dict or string)
         milestones_json = json.dumps({"not": "a list"})
 
-        result = asyncio.run(tool_func(milestones=milestones_json))
+        result = await tool_func(milestones=milestones_json)
 
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Timeline"
         assert len(builder.components) >= 1
 
-    def test_tool_execution_with_none_milestone_items(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_with_none_milestone_items(self, registered_tool):
         """Test tool execution when milestone parsing returns None."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Timeline.tool import register_tool
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        # Mock ProjectManager with current_timeline
-        pm_mock = Mock()
-        builder = CompositionBuilder(fps=30)
-        pm_mock.current_timeline = builder
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, builder = registered_tool
 
         # Test with milestones that include items without 'type' (will parse to non-ComponentInstance)
         milestones_json = json.dumps(
@@ -278,8 +98,8 @@ class TestTimelineToolRegistration:
             ]
         )
 
-        result = asyncio.run(tool_func(milestones=milestones_json))
+        result = await tool_func(milestones=milestones_json)
 
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Timeline"
         assert len(builder.components) >= 1
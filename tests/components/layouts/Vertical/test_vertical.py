@@ -1,77 +1,64 @@
 """Tests for Vertical template generation."""
 
+import pytest
 from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
+    assert_tool_error,
+    assert_valid_component,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.layouts.Vertical.builder import add_to_composition
+from chuk_motion.components.layouts.Vertical.tool import register_tool
+
+pytestmark = pytest.mark.xdist_group("layouts_vertical")
+
+# Props passed to add_to_composition; every one must land unchanged on the component
+ALL_PROPS = {
+    "top": {"type": "top"},
+    "bottom": {"type": "bottom"},
+    "layout_style": "split-vertical",
+    "top_ratio": 60.0,
+    "gap": 25.0,
+    "padding": 50.0,
+}
+
 
 class TestVerticalBasic:
     """Basic Vertical generation tests."""
 
-    def test_basic_generation(self, component_builder, theme_name):
+    def test_basic_generation(self, cached_build, theme_name):
         """Test basic Vertical generation."""
-        tsx = component_builder.build_component("Vertical", {}, theme_name)
+        tsx = cached_build("Vertical", {}, theme_name)
         assert tsx is not None
         assert "Vertical" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "Vertical")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
+        assert_valid_component(tsx, "Vertical")
 
 
 class TestVerticalBuilderMethod:
     """Tests for Vertical builder method."""
 
-    def test_add_to_composition_basic(self):
+    def test_add_to_composition_basic(self, stub_builder):
         """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.layouts.Vertical.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, start_time=0.0)
+        result = add_to_composition(stub_builder, start_time=0.0)
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "Vertical"
+        assert result is stub_builder
+        assert len(stub_builder.components) == 1
+        assert stub_builder.components[0].component_type == "Vertical"
 
-    def test_add_to_composition_all_props(self):
+    def test_add_to_composition_all_props(self, stub_builder):
         """Test all props are set correctly."""
-        from chuk_motion.components.layouts.Vertical.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        add_to_composition(
-            builder,
-            start_time=1.0,
-            top={"type": "top"},
-            bottom={"type": "bottom"},
-            layout_style="split-vertical",
-            top_ratio=60.0,
-            gap=25.0,
-            padding=50.0,
-            duration=10.0,
-        )
-
-        props = builder.components[0].props
-        assert props["top"] == {"type": "top"}
-        assert props["bottom"] == {"type": "bottom"}
-        assert props["layout_style"] == "split-vertical"
-        assert props["top_ratio"] == 60.0
-        assert props["gap"] == 25.0
-        assert props["padding"] == 50.0
-
-    def test_add_to_composition_timing(self):
-        """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.layouts.Vertical.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
+        add_to_composition(stub_builder, start_time=1.0, duration=10.0, **ALL_PROPS)
+
+        props = stub_builder.components[0].props
+        for key, value in ALL_PROPS.items():
+            assert props[key] == value
 
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, start_time=2.0, duration=5.0)
+    def test_add_to_composition_timing(self, stub_builder):
+        """Test add_to_composition handles timing correctly."""
+        add_to_composition(stub_builder, start_time=2.0, duration=5.0)
 
-        component = builder.components[0]
+        component = stub_builder.components[0]
         assert component.start_frame == 60
         assert component.duration_frames == 150
 
@@ -79,111 +66,49 @@ class TestVerticalBuilderMethod:
 class TestVerticalToolRegistration:
     """Tests for Vertical MCP tool registration."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the Vertical tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        from chuk_motion.components.layouts.Vertical.tool import register_tool
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_vertical"], timeline
 
-        mcp_mock = Mock()
-        pm_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
+    def test_register_tool(self, mock_mcp_server, project_manager):
+        """Test tool registration."""
+        register_tool(mock_mcp_server, project_manager)
 
-        mcp_mock.tool.assert_called_once()
+        assert list(mock_mcp_server.tools) == ["remotion_add_vertical"]
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Vertical.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Use real Timeline with builder methods registered (via conftest.py)
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
-        result = asyncio.run(tool_func())
+        result = await tool_func()
 
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "Vertical"
 
         # Verify component was added
         assert len(timeline.get_all_components()) >= 1
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution without active project."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Vertical.tool import register_tool
-
-        # Mock ProjectManager with no current_timeline
-        pm_mock = Mock()
-        pm_mock.current_timeline = None
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-
-        tool_func = mcp_mock.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func())
-        result_data = json.loads(result)
-        assert "error" in result_data
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool handles errors gracefully."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.layouts.Vertical.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Use real Timeline but patch add_vertical to raise error
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
         # Patch the builder method to raise error
-        with patch.object(timeline, "add_vertical", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func())
+        timeline.add_vertical = raising("Test error")
+        result = await tool_func()
 
-        result_data = json.loads(result)
-        assert "error" in result_data
+        assert_tool_error(result)
 
-    def test_tool_json_parsing_error(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_json_parsing_error(self, registered_tool):
         """Test tool handles JSON parsing errors."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.layouts.Vertical.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        # Use real Timeline
-        pm_mock = Mock()
-        timeline = Timeline(fps=30)
-        pm_mock.current_timeline = timeline
-
-        mcp_mock = Mock()
-        register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func, _ = registered_tool
 
         # Test with invalid JSON
-        result = asyncio.run(tool_func(top="invalid json {"))
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Invalid component JSON" in result_data["error"]
+        result = await tool_func(top="invalid json {")
+        assert_tool_error(result, "Invalid component JSON")
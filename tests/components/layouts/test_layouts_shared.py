@@ -0,0 +1,218 @@
+"""Shared generation, builder and registration tests for layout components."""
+
+import pytest
+from tests.components.conftest import assert_tool_error, assert_valid_component
+
+from chuk_motion.components.layouts.Mosaic.builder import add_to_composition as add_mosaic
+from chuk_motion.components.layouts.Mosaic.tool import register_tool as register_mosaic
+from chuk_motion.components.layouts.PerformanceMultiCam.builder import (
+    add_to_composition as add_performance_multi_cam,
+)
+from chuk_motion.components.layouts.PerformanceMultiCam.tool import (
+    register_tool as register_performance_multi_cam,
+)
+from chuk_motion.components.layouts.PiP.builder import add_to_composition as add_pip
+from chuk_motion.components.layouts.PiP.tool import register_tool as register_pip
+from chuk_motion.components.layouts.SplitScreen.builder import (
+    add_to_composition as add_split_screen,
+)
+from chuk_motion.components.layouts.SplitScreen.tool import register_tool as register_split_screen
+from chuk_motion.components.layouts.ThreeByThreeGrid.builder import (
+    add_to_composition as add_three_by_three_grid,
+)
+from chuk_motion.components.layouts.ThreeByThreeGrid.tool import (
+    register_tool as register_three_by_three_grid,
+)
+from chuk_motion.components.layouts.Timeline.builder import add_to_composition as add_timeline
+from chuk_motion.components.layouts.Timeline.tool import register_tool as register_timeline
+
+pytestmark = pytest.mark.xdist_group("layouts_shared")
+
+COMPONENTS = [
+    "Mosaic",
+    "PerformanceMultiCam",
+    "PiP",
+    "SplitScreen",
+    "ThreeByThreeGrid",
+    "Timeline",
+]
+
+# (component name, add_to_composition, kwargs the builder requires)
+BUILDERS = [
+    pytest.param("Mosaic", add_mosaic, {}, id="Mosaic"),
+    pytest.param("PerformanceMultiCam", add_performance_multi_cam, {}, id="PerformanceMultiCam"),
+    pytest.param("PiP", add_pip, {}, id="PiP"),
+    pytest.param("SplitScreen", add_split_screen, {}, id="SplitScreen"),
+    pytest.param("ThreeByThreeGrid", add_three_by_three_grid, {"items": []}, id="ThreeByThreeGrid"),
+    pytest.param("Timeline", add_timeline, {}, id="Timeline"),
+]
+
+TOOLS = [
+    pytest.param(register_mosaic, "remotion_add_mosaic", id="Mosaic"),
+    pytest.param(
+        register_performance_multi_cam,
+        "remotion_add_performance_multi_cam",
+        id="PerformanceMultiCam",
+    ),
+    pytest.param(register_pip, "remotion_add_pip", id="PiP"),
+    pytest.param(register_split_screen, "remotion_add_split_screen", id="SplitScreen"),
+    pytest.param(
+        register_three_by_three_grid, "remotion_add_three_by_three_grid", id="ThreeByThreeGrid"
+    ),
+    pytest.param(register_timeline, "remotion_add_timeline", id="Timeline"),
+]
+
+# Not parseable as JSON; every component argument must reject it
+INVALID_JSON = "invalid json {"
+
+# (register_tool, kwargs carrying the bad payload, expected error fragment)
+INVALID_JSON_CASES = [
+    pytest.param(register_mosaic, {"clips": INVALID_JSON}, "Invalid", id="Mosaic"),
+    pytest.param(
+        register_performance_multi_cam,
+        {"primary_cam": INVALID_JSON, "secondary_cams": INVALID_JSON, "layout": "primary-main"},
+        "Invalid JSON",
+        id="PerformanceMultiCam",
+    ),
+    pytest.param(register_pip, {"main_content": INVALID_JSON}, "Invalid component JSON", id="PiP"),
+    pytest.param(
+        register_split_screen,
+        {"left_content": INVALID_JSON, "duration": 5.0},
+        "Invalid component JSON",
+        id="SplitScreen",
+    ),
+    pytest.param(
+        register_three_by_three_grid, {"items": INVALID_JSON}, "Invalid", id="ThreeByThreeGrid"
+    ),
+    pytest.param(register_timeline, {"main_content": INVALID_JSON}, "Invalid", id="Timeline"),
+]
+
+# One item per cell of the 3x3 grid
+GRID_ITEMS = [{"id": f"item{i}"} for i in range(9)]
+
+# Props passed to add_to_composition; every one must land unchanged on the component
+ALL_PROPS = [
+    pytest.param(
+        add_mosaic,
+        {
+            "clips": [{"id": "clip1"}, {"id": "clip2"}],
+            "style": "grid",
+            "gap": 15.0,
+            "padding": 50.0,
+        },
+        id="Mosaic",
+    ),
+    pytest.param(
+        add_performance_multi_cam,
+        {
+            "primary_cam": {"type": "primary"},
+            "secondary_cams": [{"id": "cam1"}, {"id": "cam2"}],
+            "layout": "grid",
+            "gap": 25.0,
+            "padding": 50.0,
+        },
+        id="PerformanceMultiCam",
+    ),
+    pytest.param(
+        add_pip,
+        {
+            "main_content": {"type": "main"},
+            "pip_content": {"type": "pip"},
+            "position": "top-left",
+            "overlay_size": 25.0,
+            "margin": 50.0,
+        },
+        id="PiP",
+    ),
+    pytest.param(
+        add_split_screen,
+        {
+            "orientation": "horizontal",
+            "layout": "50-50",
+            "gap": 30,
+            "left_content": "left",
+            "right_content": "right",
+        },
+        id="SplitScreen",
+    ),
+    pytest.param(
+        add_three_by_three_grid,
+        {"items": GRID_ITEMS, "gap": 25.0, "padding": 50.0},
+        id="ThreeByThreeGrid",
+    ),
+    pytest.param(
+        add_timeline,
+        {
+            "main_content": {"type": "main"},
+            "milestones": [{"time": 1.0, "label": "Event 1"}],
+            "current_time": 5.0,
+            "total_duration": 15.0,
+            "position": "top",
+            "height": 120.0,
+        },
+        id="Timeline",
+    ),
+]
+
+
+@pytest.mark.parametrize("component_name", COMPONENTS)
+def test_basic_generation(cached_build, theme_name, component_name):
+    """Test basic layout generation."""
+    tsx = cached_build(component_name, {}, theme_name)
+    assert tsx is not None
+    assert component_name in tsx
+    assert_valid_component(tsx, component_name)
+
+
+@pytest.mark.parametrize(("component_name", "add_fn", "required"), BUILDERS)
+def test_add_to_composition_basic(stub_builder, component_name, add_fn, required):
+    """Test add_to_composition creates ComponentInstance."""
+    result = add_fn(stub_builder, start_time=0.0, **required)
+
+    assert result is stub_builder
+    assert len(stub_builder.components) == 1
+    assert stub_builder.components[0].component_type == component_name
+
+
+@pytest.mark.parametrize(("add_fn", "props"), ALL_PROPS)
+def test_add_to_composition_all_props(stub_builder, add_fn, props):
+    """Test all props are set correctly."""
+    add_fn(stub_builder, start_time=1.0, duration=10.0, **props)
+
+    component_props = stub_builder.components[0].props
+    for key, value in props.items():
+        assert component_props[key] == value
+
+
+@pytest.mark.parametrize(("component_name", "add_fn", "required"), BUILDERS)
+def test_add_to_composition_timing(stub_builder, component_name, add_fn, required):
+    """Test add_to_composition handles timing correctly."""
+    add_fn(stub_builder, start_time=2.0, duration=5.0, **required)
+
+    component = stub_builder.components[0]
+    assert component.start_frame == 60
+    assert component.duration_frames == 150
+
+
+@pytest.mark.parametrize(("register_tool", "tool_name"), TOOLS)
+def test_register_tool(mock_mcp_server, project_manager, register_tool, tool_name):
+    """Test tool registration."""
+    register_tool(mock_mcp_server, project_manager)
+
+    assert list(mock_mcp_server.tools) == [tool_name]
+
+
+@pytest.mark.parametrize(("register_tool", "kwargs", "fragment"), INVALID_JSON_CASES)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tool_json_parsing_error(
+    mock_mcp_server, project_manager, timeline, register_tool, kwargs, fragment
+):
+    """Test tool handles JSON parsing errors."""
+    project_manager.current_timeline = timeline
+    register_tool(mock_mcp_server, project_manager)
+    [tool_func] = mock_mcp_server.tools.values()
+
+    result = await tool_func(**kwargs)
+
+    assert_tool_error(result, fragment)
+    assert not timeline.get_all_components()
@@ -0,0 +1,53 @@
+"""Tests for layout MCP tools when no project is active."""
+
+from types import SimpleNamespace
+
+import pytest
+from tests.components.conftest import assert_tool_error
+
+from chuk_motion.components.layouts.FocusStrip.tool import register_tool as register_focus_strip
+from chuk_motion.components.layouts.Grid.tool import register_tool as register_grid
+from chuk_motion.components.layouts.HUDStyle.tool import register_tool as register_hud_style
+from chuk_motion.components.layouts.Mosaic.tool import register_tool as register_mosaic
+from chuk_motion.components.layouts.PerformanceMultiCam.tool import (
+    register_tool as register_performance_multi_cam,
+)
+from chuk_motion.components.layouts.PiP.tool import register_tool as register_pip
+from chuk_motion.components.layouts.SplitScreen.tool import register_tool as register_split_screen
+from chuk_motion.components.layouts.ThreeByThreeGrid.tool import (
+    register_tool as register_three_by_three_grid,
+)
+from chuk_motion.components.layouts.Timeline.tool import register_tool as register_timeline
+from chuk_motion.components.layouts.Vertical.tool import register_tool as register_vertical
+
+pytestmark = pytest.mark.xdist_group("layouts_no_project")
+
+
+@pytest.mark.parametrize(
+    ("register_tool", "kwargs"),
+    [
+        pytest.param(register_focus_strip, {}, id="FocusStrip"),
+        pytest.param(register_hud_style, {}, id="HUDStyle"),
+        pytest.param(register_mosaic, {}, id="Mosaic"),
+        pytest.param(register_performance_multi_cam, {}, id="PerformanceMultiCam"),
+        pytest.param(register_pip, {}, id="PiP"),
+        pytest.param(register_split_screen, {"duration": 5.0}, id="SplitScreen"),
+        pytest.param(
+            register_three_by_three_grid, {"items": "invalid json {"}, id="ThreeByThreeGrid"
+        ),
+        pytest.param(register_timeline, {}, id="Timeline"),
+        pytest.param(register_vertical, {}, id="Vertical"),
+        pytest.param(register_grid, {"items": '[{"title": "A"}]', "duration": 5.0}, id="Grid"),
+    ],
+)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tool_execution_no_project(register_tool, kwargs, mock_mcp_server):
+    """Test tool execution without active project."""
+    # The tools only read current_timeline before bailing out
+    project_manager = SimpleNamespace(current_timeline=None)
+    register_tool(mock_mcp_server, project_manager)
+    [tool_func] = mock_mcp_server.tools.values()
+
+    result = await tool_func(**kwargs)
+
+    assert_tool_error(result, "No active project")
@@ -1,33 +1,46 @@
-# chuk-motion/src/chuk_motion/components/overlays/EndScreen/test_end_screen.py
+# chuk-motion/tests/components/overlays/EndScreen/test_end_screen.py
 """
 Tests for EndScreen template generation.
 """
 
+import pytest
 from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_valid_typescript,
+    assert_tool_error,
+    assert_valid_component,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.overlays.EndScreen.builder import add_to_composition
+from chuk_motion.components.overlays.EndScreen.tool import register_tool
+
+pytestmark = pytest.mark.xdist_group("overlays_endscreen")
+
+# Props passed to add_to_composition; every one must land unchanged on the component
+ALL_PROPS = {
+    "cta_text": "Subscribe",
+    "thumbnail_url": "http://example.com/thumb.jpg",
+    "variant": "modern",
+    "duration_seconds": 10.0,
+}
+
 
 class TestEndScreenBasic:
     """Basic EndScreen generation tests."""
 
-    def test_basic_generation(self, component_builder, theme_name):
+    def test_basic_generation(self, cached_build, theme_name):
         """Test basic EndScreen generation with all props."""
-        tsx = component_builder.build_component(
+        tsx = cached_build(
             "EndScreen", {"text": "Test Text", "start_time": 0.0, "duration": 3.0}, theme_name
         )
 
         assert tsx is not None
         assert "EndScreen" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "EndScreen")
-        assert_has_timing_props(tsx)
+        assert_valid_component(tsx, "EndScreen")
 
-    def test_minimal_props(self, component_builder, theme_name):
+    def test_minimal_props(self, cached_build, theme_name):
         """Test EndScreen with minimal props."""
-        tsx = component_builder.build_component("EndScreen", {}, theme_name)
+        tsx = cached_build("EndScreen", {}, theme_name)
 
         assert tsx is not None
 
@@ -35,122 +48,60 @@ class TestEndScreenBasic:
 class TestEndScreenBuilderMethod:
     """Tests for EndScreen builder method."""
 
-    def test_add_to_composition_basic(self):
+    def test_add_to_composition_basic(self, composition_builder):
         """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.overlays.EndScreen.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
+        result = add_to_composition(composition_builder, cta_text="Subscribe")
 
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, cta_text="Subscribe")
+        assert result is composition_builder
+        assert len(composition_builder.components) == 1
+        assert composition_builder.components[0].component_type == "EndScreen"
+        assert composition_builder.components[0].props["cta_text"] == "Subscribe"
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "EndScreen"
-        assert builder.components[0].props["cta_text"] == "Subscribe"
-
-    def test_add_to_composition_all_props(self):
+    def test_add_to_composition_all_props(self, composition_builder):
         """Test all props are set correctly."""
-        from chuk_motion.components.overlays.EndScreen.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        add_to_composition(
-            builder,
-            cta_text="Subscribe",
-            thumbnail_url="http://example.com/thumb.jpg",
-            variant="modern",
-            duration_seconds=10.0,
-        )
+        add_to_composition(composition_builder, **ALL_PROPS)
 
-        props = builder.components[0].props
-        assert props["cta_text"] == "Subscribe"
-        assert props["thumbnail_url"] == "http://example.com/thumb.jpg"
-        assert props["variant"] == "modern"
-        assert props["duration_seconds"] == 10.0
+        props = composition_builder.components[0].props
+        for key, value in ALL_PROPS.items():
+            assert props[key] == value
 
 
 class TestEndScreenToolRegistration:
     """Tests for EndScreen MCP tool."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.EndScreen.tool import register_tool
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the EndScreen tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        mcp = Mock()
-        project_manager = Mock()
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_end_screen"], timeline
 
-        register_tool(mcp, project_manager)
+    def test_register_tool(self, mock_mcp_server, project_manager):
+        """Test tool registration."""
+        register_tool(mock_mcp_server, project_manager)
 
-        assert mcp.tool.called or hasattr(mcp, "tool")
+        assert list(mock_mcp_server.tools) == ["remotion_add_end_screen"]
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution creates component."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.EndScreen.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
+        tool_func, timeline = registered_tool
 
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(cta_text="Test", duration=8.0))
+        result = await tool_func(cta_text="Test", duration=8.0)
 
         # Check component was added
         assert len(timeline.get_all_components()) >= 1
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "EndScreen"
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution when no project exists."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.EndScreen.tool import register_tool
-
-        mcp = Mock()
-        project_manager = Mock()
-        project_manager.current_timeline = None  # No project
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(cta_text="Test", duration=8.0))
-
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "No active project" in result_data["error"]
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool execution handles exceptions."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.overlays.EndScreen.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
         # Mock add_component to raise exception
-        with patch.object(timeline, "add_component", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func(cta_text="Test", duration=8.0))
+        timeline.add_component = raising("Test error")
+        result = await tool_func(cta_text="Test", duration=8.0)
 
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Test error" in result_data["error"]
+        assert_tool_error(result, "Test error")
@@ -1,24 +1,41 @@
-# chuk-motion/src/chuk_motion/components/overlays/LowerThird/test_lowerthird.py
+# chuk-motion/tests/components/overlays/LowerThird/test_lowerthird.py
 """
 Tests for LowerThird template generation.
 """
 
 import pytest
 from tests.components.conftest import (
+    assert_contains_all,
     assert_design_tokens_injected,
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_has_visibility_check,
-    assert_valid_typescript,
+    assert_tool_error,
+    assert_valid_component,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.overlays.LowerThird.builder import add_to_composition
+from chuk_motion.components.overlays.LowerThird.tool import register_tool
+
+pytestmark = pytest.mark.xdist_group("overlays_lowerthird")
+
+POSITIONS = ("bottom_left", "bottom_center", "bottom_right", "top_left", "top_center", "top_right")
+VARIANTS = ("minimal", "standard", "glass", "bold", "animated")
+
+# Props passed to add_to_composition; every one must land unchanged on the component
+ALL_PROPS = {
+    "name": "John Doe",
+    "title": "CEO",
+    "variant": "modern",
+    "position": "bottom-left",
+}
+
 
 class TestLowerThirdBasic:
     """Basic LowerThird generation tests."""
 
-    def test_basic_generation(self, component_builder, theme_name):
+    def test_basic_generation(self, cached_build, theme_name):
         """Test basic LowerThird generation with all props."""
-        tsx = component_builder.build_component(
+        tsx = cached_build(
             "LowerThird",
             {
                 "name": "Speaker Name",
@@ -31,14 +48,11 @@ class TestLowerThirdBasic:
 
         assert tsx is not None
         assert "LowerThird" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "LowerThird")
-        assert_has_timing_props(tsx)
-        assert_has_visibility_check(tsx)
+        assert_valid_component(tsx, "LowerThird")
 
-    def test_minimal_props(self, component_builder, theme_name):
+    def test_minimal_props(self, cached_build, theme_name):
         """Test LowerThird with only required props."""
-        tsx = component_builder.build_component("LowerThird", {"name": "Speaker"}, theme_name)
+        tsx = cached_build("LowerThird", {"name": "Speaker"}, theme_name)
 
         assert tsx is not None
         # Should have defaults
@@ -49,51 +63,38 @@ class TestLowerThirdBasic:
 class TestLowerThirdPositions:
     """Tests for LowerThird position variants."""
 
-    @pytest.mark.parametrize(
-        "position",
-        ["bottom_left", "bottom_center", "bottom_right", "top_left", "top_center", "top_right"],
-    )
-    def test_position_variant(self, component_builder, theme_name, position):
+    @pytest.mark.parametrize("position", POSITIONS)
+    def test_position_variant(self, cached_build, theme_name, position):
         """Test each position variant generates correctly."""
-        tsx = component_builder.build_component(
-            "LowerThird", {"name": "Test", "position": position}, theme_name
-        )
+        tsx = cached_build("LowerThird", {"name": "Test", "position": position}, theme_name)
 
         assert tsx is not None
         assert position in tsx
         assert "positionStyle" in tsx
 
-    def test_position_mapping(self, component_builder, theme_name):
+    def test_position_mapping(self, cached_build, theme_name):
         """Test that positions map to correct CSS properties."""
-        tsx = component_builder.build_component(
-            "LowerThird", {"name": "Test", "position": "bottom_left"}, theme_name
-        )
+        tsx = cached_build("LowerThird", {"name": "Test", "position": "bottom_left"}, theme_name)
 
         # Should have interpolate for slide animation
-        assert "interpolate" in tsx
-        assert "bottom" in tsx
-        assert "left" in tsx
+        assert_contains_all(tsx, ("interpolate", "bottom", "left"))
 
 
 class TestLowerThirdVariants:
     """Tests for LowerThird style variants."""
 
-    @pytest.mark.parametrize("variant", ["minimal", "standard", "glass", "bold", "animated"])
-    def test_style_variant(self, component_builder, theme_name, variant):
+    @pytest.mark.parametrize("variant", VARIANTS)
+    def test_style_variant(self, cached_build, theme_name, variant):
         """Test each style variant generates correctly."""
-        tsx = component_builder.build_component(
-            "LowerThird", {"name": "Test", "variant": variant}, theme_name
-        )
+        tsx = cached_build("LowerThird", {"name": "Test", "variant": variant}, theme_name)
 
         assert tsx is not None
         assert variant in tsx
         assert "variantStyle" in tsx
 
-    def test_glass_variant_backdrop(self, component_builder, theme_name):
+    def test_glass_variant_backdrop(self, cached_build, theme_name):
         """Test glass variant has backdrop filter."""
-        tsx = component_builder.build_component(
-            "LowerThird", {"name": "Test", "variant": "glass"}, theme_name
-        )
+        tsx = cached_build("LowerThird", {"name": "Test", "variant": "glass"}, theme_name)
 
         assert "backdropFilter" in tsx or "blur" in tsx
 
@@ -101,64 +102,56 @@ class TestLowerThirdVariants:
 class TestLowerThirdAnimation:
     """Tests for LowerThird slide animation."""
 
-    def test_has_slide_animation(self, component_builder, theme_name):
+    def test_has_slide_animation(self, cached_build, theme_name):
         """Test LowerThird has slide-in animation."""
-        tsx = component_builder.build_component("LowerThird", {"name": "Test"}, theme_name)
+        tsx = cached_build("LowerThird", {"name": "Test"}, theme_name)
 
-        assert "slideIn" in tsx
-        assert "spring" in tsx
-        assert "interpolate" in tsx
+        assert_contains_all(tsx, ("slideIn", "spring", "interpolate"))
 
-    def test_uses_motion_tokens(self, component_builder, theme_name):
+    def test_uses_motion_tokens(self, cached_build, theme_name):
         """Test animation uses motion tokens from theme."""
-        tsx = component_builder.build_component("LowerThird", {"name": "Test"}, theme_name)
+        tsx = cached_build("LowerThird", {"name": "Test"}, theme_name)
 
         # Should use motion config
-        assert "damping" in tsx
-        assert "stiffness" in tsx
+        assert_contains_all(tsx, ("damping", "stiffness"))
         assert "50.0" in tsx or "120.0" in tsx  # Actual spring config values
 
-    def test_has_fade_in_out(self, component_builder, theme_name):
+    def test_has_fade_in_out(self, cached_build, theme_name):
         """Test LowerThird has fade in and fade out."""
-        tsx = component_builder.build_component("LowerThird", {"name": "Test"}, theme_name)
+        tsx = cached_build("LowerThird", {"name": "Test"}, theme_name)
 
-        assert "opacity" in tsx
-        assert "fadeOut" in tsx
-        assert "finalOpacity" in tsx
+        assert_contains_all(tsx, ("opacity", "fadeOut", "finalOpacity"))
 
 
 class TestLowerThirdContent:
     """Tests for LowerThird content rendering."""
 
-    def test_name_only(self, component_builder, theme_name):
+    def test_name_only(self, cached_build, theme_name):
         """Test LowerThird with name only (no title)."""
-        tsx = component_builder.build_component("LowerThird", {"name": "Test Name"}, theme_name)
+        tsx = cached_build("LowerThird", {"name": "Test Name"}, theme_name)
 
-        assert "{name}" in tsx
-        assert "title &&" in tsx  # Conditional rendering
+        # title is rendered conditionally
+        assert_contains_all(tsx, ("{name}", "title &&"))
 
-    def test_name_and_title(self, component_builder, theme_name):
+    def test_name_and_title(self, cached_build, theme_name):
         """Test LowerThird with both name and title."""
-        tsx = component_builder.build_component(
-            "LowerThird", {"name": "Test Name", "title": "Test Title"}, theme_name
-        )
+        tsx = cached_build("LowerThird", {"name": "Test Name", "title": "Test Title"}, theme_name)
 
-        assert "{name}" in tsx
-        assert "{title}" in tsx
+        assert_contains_all(tsx, ("{name}", "{title}"))
 
 
 class TestLowerThirdDesignTokens:
     """Tests for design token integration."""
 
-    def test_design_tokens_injected(self, component_builder, theme_name):
+    def test_design_tokens_injected(self, cached_build, theme_name):
         """Test that design tokens are properly injected."""
-        tsx = component_builder.build_component("LowerThird", {"name": "Test"}, theme_name)
+        tsx = cached_build("LowerThird", {"name": "Test"}, theme_name)
 
         assert_design_tokens_injected(tsx)
 
-    def test_font_family_from_theme(self, component_builder, theme_name):
+    def test_font_family_from_theme(self, cached_build, theme_name):
         """Test font family comes from theme."""
-        tsx = component_builder.build_component("LowerThird", {"name": "Test"}, theme_name)
+        tsx = cached_build("LowerThird", {"name": "Test"}, theme_name)
 
         assert "fontFamily" in tsx
         assert "Inter" in tsx or "SF Pro" in tsx
@@ -167,50 +160,28 @@ class TestLowerThirdDesignTokens:
 class TestLowerThirdBuilderMethod:
     """Tests for LowerThird builder method."""
 
-    def test_add_to_composition_basic(self):
+    def test_add_to_composition_basic(self, stub_builder):
         """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.overlays.LowerThird.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, name="John Doe", start_time=0.0)
+        result = add_to_composition(stub_builder, name="John Doe", start_time=0.0)
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "LowerThird"
-        assert builder.components[0].props["name"] == "John Doe"
+        assert result is stub_builder
+        assert len(stub_builder.components) == 1
+        assert stub_builder.components[0].component_type == "LowerThird"
+        assert stub_builder.components[0].props["name"] == "John Doe"
 
-    def test_add_to_composition_all_props(self):
+    def test_add_to_composition_all_props(self, stub_builder):
         """Test all props are set correctly."""
-        from chuk_motion.components.overlays.LowerThird.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        add_to_composition(
-            builder,
-            name="John Doe",
-            start_time=1.0,
-            title="CEO",
-            variant="modern",
-            position="bottom-left",
-            duration=5.0,
-        )
+        add_to_composition(stub_builder, start_time=1.0, duration=5.0, **ALL_PROPS)
 
-        props = builder.components[0].props
-        assert props["name"] == "John Doe"
-        assert props["title"] == "CEO"
-        assert props["variant"] == "modern"
-        assert props["position"] == "bottom-left"
+        props = stub_builder.components[0].props
+        for key, value in ALL_PROPS.items():
+            assert props[key] == value
 
-    def test_add_to_composition_timing(self):
+    def test_add_to_composition_timing(self, stub_builder):
         """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.overlays.LowerThird.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, name="Test", start_time=2.0, duration=5.0)
+        add_to_composition(stub_builder, name="Test", start_time=2.0, duration=5.0)
 
-        component = builder.components[0]
+        component = stub_builder.components[0]
         assert component.start_frame == 60
         assert component.duration_frames == 150
 
@@ -218,85 +189,39 @@ class TestLowerThirdBuilderMethod:
 class TestLowerThirdToolRegistration:
     """Tests for LowerThird MCP tool."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.LowerThird.tool import register_tool
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the LowerThird tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        mcp = Mock()
-        project_manager = Mock()
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_lower_third"], timeline
 
-        register_tool(mcp, project_manager)
+    def test_register_tool(self, mock_mcp_server, project_manager):
+        """Test tool registration."""
+        register_tool(mock_mcp_server, project_manager)
 
-        assert mcp.tool.called or hasattr(mcp, "tool")
+        assert list(mock_mcp_server.tools) == ["remotion_add_lower_third"]
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution creates component."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.LowerThird.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
+        tool_func, timeline = registered_tool
 
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(name="Test", duration=5.0))
+        result = await tool_func(name="Test", duration=5.0)
 
         # Check component was added
         assert len(timeline.get_all_components()) >= 1
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "LowerThird"
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution when no project exists."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.LowerThird.tool import register_tool
-
-        mcp = Mock()
-        project_manager = Mock()
-        project_manager.current_timeline = None  # No project
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(name="Test", duration=5.0))
-
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "No active project" in result_data["error"]
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool execution handles exceptions."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.overlays.LowerThird.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
         # Mock add_lower_third to raise exception
-        with patch.object(timeline, "add_lower_third", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func(name="Test", duration=5.0))
+        timeline.add_lower_third = raising("Test error")
+        result = await tool_func(name="Test", duration=5.0)
 
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Test error" in result_data["error"]
+        assert_tool_error(result, "Test error")
@@ -1,33 +1,47 @@
-# chuk-motion/src/chuk_motion/components/overlays/TextOverlay/test_text_overlay.py
+# chuk-motion/tests/components/overlays/TextOverlay/test_text_overlay.py
 """
 Tests for TextOverlay template generation.
 """
 
+import pytest
 from tests.components.conftest import (
-    assert_has_interface,
-    assert_has_timing_props,
-    assert_valid_typescript,
+    assert_tool_error,
+    assert_valid_component,
+    parse_tool_result,
+    raising,
 )
 
+from chuk_motion.components.overlays.TextOverlay.builder import add_to_composition
+from chuk_motion.components.overlays.TextOverlay.tool import register_tool
+
+pytestmark = pytest.mark.xdist_group("overlays_textoverlay")
+
+# Config for the full-props generation test
+BASIC_PROPS = {"text": "Test Text", "start_time": 0.0, "duration": 3.0}
+
+# Props passed to add_to_composition; every one must land unchanged on the component
+ALL_PROPS = {
+    "text": "Hello World",
+    "style": "bold",
+    "animation": "fade_in",
+    "position": "center",
+}
+
 
 class TestTextOverlayBasic:
     """Basic TextOverlay generation tests."""
 
-    def test_basic_generation(self, component_builder, theme_name):
+    def test_basic_generation(self, cached_build, theme_name):
         """Test basic TextOverlay generation with all props."""
-        tsx = component_builder.build_component(
-            "TextOverlay", {"text": "Test Text", "start_time": 0.0, "duration": 3.0}, theme_name
-        )
+        tsx = cached_build("TextOverlay", BASIC_PROPS, theme_name)
 
         assert tsx is not None
         assert "TextOverlay" in tsx
-        assert_valid_typescript(tsx)
-        assert_has_interface(tsx, "TextOverlay")
-        assert_has_timing_props(tsx)
+        assert_valid_component(tsx, "TextOverlay")
 
-    def test_minimal_props(self, component_builder, theme_name):
+    def test_minimal_props(self, cached_build, theme_name):
         """Test TextOverlay with minimal props."""
-        tsx = component_builder.build_component("TextOverlay", {}, theme_name)
+        tsx = cached_build("TextOverlay", {}, theme_name)
 
         assert tsx is not None
 
@@ -35,50 +49,19 @@ class TestTextOverlayBasic:
 class TestTextOverlayBuilderMethod:
     """Tests for TextOverlay builder method."""
 
-    def test_add_to_composition_basic(self):
-        """Test add_to_composition creates ComponentInstance."""
-        from chuk_motion.components.overlays.TextOverlay.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        result = add_to_composition(builder, text="Hello World", start_time=0.0)
+    def test_add_to_composition_all_props(self, stub_builder):
+        """Test all props are set correctly."""
+        add_to_composition(stub_builder, start_time=1.0, duration=3.0, **ALL_PROPS)
 
-        assert result is builder
-        assert len(builder.components) == 1
-        assert builder.components[0].component_type == "TextOverlay"
-        assert builder.components[0].props["text"] == "Hello World"
+        props = stub_builder.components[0].props
+        for key, value in ALL_PROPS.items():
+            assert props[key] == value
 
-    def test_add_to_composition_all_props(self):
-        """Test all props are set correctly."""
-        from chuk_motion.components.overlays.TextOverlay.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
-
-        builder = CompositionBuilder()
-        add_to_composition(
-            builder,
-            text="Hello World",
-            start_time=1.0,
-            style="bold",
-            animation="fade_in",
-            duration=3.0,
-            position="center",
-        )
-
-        props = builder.components[0].props
-        assert props["text"] == "Hello World"
-        assert props["style"] == "bold"
-        assert props["animation"] == "fade_in"
-        assert props["position"] == "center"
-
-    def test_add_to_composition_timing(self):
+    def test_add_to_composition_timing(self, stub_builder):
         """Test add_to_composition handles timing correctly."""
-        from chuk_motion.components.overlays.TextOverlay.builder import add_to_composition
-        from chuk_motion.generator.composition_builder import CompositionBuilder
+        add_to_composition(stub_builder, text="Test", start_time=2.0, duration=3.0)
 
-        builder = CompositionBuilder(fps=30)
-        add_to_composition(builder, text="Test", start_time=2.0, duration=3.0)
-
-        component = builder.components[0]
+        component = stub_builder.components[0]
         assert component.start_frame == 60
         assert component.duration_frames == 90
 
@@ -86,85 +69,39 @@ class TestTextOverlayBuilderMethod:
 class TestTextOverlayToolRegistration:
     """Tests for TextOverlay MCP tool."""
 
-    def test_register_tool(self):
-        """Test tool registration."""
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.TextOverlay.tool import register_tool
+    @pytest.fixture
+    def registered_tool(self, mock_mcp_server, project_manager, timeline):
+        """Register the TextOverlay tool against a fresh timeline and return (tool_func, timeline)."""
+        project_manager.current_timeline = timeline
 
-        mcp = Mock()
-        project_manager = Mock()
+        register_tool(mock_mcp_server, project_manager)
+        return mock_mcp_server.tools["remotion_add_text_overlay"], timeline
 
-        register_tool(mcp, project_manager)
+    def test_register_tool(self, mock_mcp_server, project_manager):
+        """Test tool registration."""
+        register_tool(mock_mcp_server, project_manager)
 
-        assert mcp.tool.called or hasattr(mcp, "tool")
+        assert list(mock_mcp_server.tools) == ["remotion_add_text_overlay"]
 
-    def test_tool_execution(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution(self, registered_tool):
         """Test tool execution creates component."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.TextOverlay.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
+        tool_func, timeline = registered_tool
 
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(text="Test", duration=3.0))
+        result = await tool_func(text="Test", duration=3.0)
 
         # Check component was added
         assert len(timeline.get_all_components()) >= 1
-        result_data = json.loads(result)
+        result_data = parse_tool_result(result)
         assert result_data["component"] == "TextOverlay"
 
-    def test_tool_execution_no_project(self):
-        """Test tool execution when no project exists."""
-        import asyncio
-        import json
-        from unittest.mock import Mock
-
-        from chuk_motion.components.overlays.TextOverlay.tool import register_tool
-
-        mcp = Mock()
-        project_manager = Mock()
-        project_manager.current_timeline = None  # No project
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
-
-        result = asyncio.run(tool_func(text="Test", duration=3.0))
-
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "No active project" in result_data["error"]
-
-    def test_tool_execution_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tool_execution_error_handling(self, registered_tool):
         """Test tool execution handles exceptions."""
-        import asyncio
-        import json
-        from unittest.mock import Mock, patch
-
-        from chuk_motion.components.overlays.TextOverlay.tool import register_tool
-        from chuk_motion.generator.timeline import Timeline
-
-        mcp = Mock()
-        project_manager = Mock()
-        timeline = Timeline(fps=30)
-        project_manager.current_timeline = timeline
-
-        register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func, timeline = registered_tool
 
         # Mock add_text_overlay to raise exception
-        with patch.object(timeline, "add_text_overlay", side_effect=Exception("Test error")):
-            result = asyncio.run(tool_func(text="Test", duration=3.0))
+        timeline.add_text_overlay = raising("Test error")
+        result = await tool_func(text="Test", duration=3.0)
 
-        result_data = json.loads(result)
-        assert "error" in result_data
-        assert "Test error" in result_data["error"]
+        assert_tool_error(result, "Test error")
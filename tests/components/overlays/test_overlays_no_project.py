@@ -0,0 +1,43 @@
+"""Tests for overlay MCP tools when no project is active."""
+
+from types import SimpleNamespace
+
+import pytest
+from tests.components.conftest import assert_tool_error
+
+from chuk_motion.components.overlays.EndScreen.tool import register_tool as register_end_screen
+from chuk_motion.components.overlays.LowerThird.tool import register_tool as register_lower_third
+from chuk_motion.components.overlays.SubscribeButton.tool import (
+    register_tool as register_subscribe_button,
+)
+from chuk_motion.components.overlays.TextOverlay.tool import register_tool as register_text_overlay
+from chuk_motion.components.overlays.TitleScene.tool import register_tool as register_title_scene
+
+pytestmark = pytest.mark.xdist_group("overlays_no_project")
+
+
+@pytest.mark.parametrize(
+    ("register_tool", "kwargs"),
+    [
+        pytest.param(register_end_screen, {"cta_text": "Test", "duration": 8.0}, id="EndScreen"),
+        pytest.param(register_lower_third, {"name": "Test", "duration": 5.0}, id="LowerThird"),
+        pytest.param(register_subscribe_button, {"duration": 5.0}, id="SubscribeButton"),
+        pytest.param(register_text_overlay, {"text": "Test", "duration": 3.0}, id="TextOverlay"),
+        pytest.param(
+            register_title_scene,
+            {"text": "Title Text", "duration_seconds": 3.0},
+            id="TitleScene",
+        ),
+    ],
+)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tool_execution_no_project(register_tool, kwargs, mock_mcp_server):
+    """Test tool execution without active project."""
+    # The tools only read current_timeline before bailing out
+    project_manager = SimpleNamespace(current_timeline=None)
+    register_tool(mock_mcp_server, project_manager)
+    [tool_func] = mock_mcp_server.tools.values()
+
+    result = await tool_func(**kwargs)
+
+    assert_tool_error(result, "No active project")
@@ -0,0 +1,43 @@
+"""Shared builder tests for overlay components."""
+
+import pytest
+
+from chuk_motion.components.overlays.SubscribeButton.builder import (
+    add_to_composition as add_subscribe_button,
+)
+from chuk_motion.components.overlays.TextOverlay.builder import (
+    add_to_composition as add_text_overlay,
+)
+from chuk_motion.components.overlays.TitleScene.builder import (
+    add_to_composition as add_title_scene,
+)
+
+pytestmark = pytest.mark.xdist_group("overlays_shared")
+
+# (component name, add_to_composition, timing kwargs, props that must land on the component)
+BUILDERS = [
+    pytest.param(
+        "SubscribeButton", add_subscribe_button, {"start_time": 0.0}, {}, id="SubscribeButton"
+    ),
+    pytest.param(
+        "TextOverlay",
+        add_text_overlay,
+        {"start_time": 0.0},
+        {"text": "Hello World"},
+        id="TextOverlay",
+    ),
+    pytest.param("TitleScene", add_title_scene, {}, {"text": "Title Text"}, id="TitleScene"),
+]
+
+
+@pytest.mark.parametrize(("component_name", "add_fn", "timing", "props"), BUILDERS)
+def test_add_to_composition_basic(stub_builder, component_name, add_fn, timing, props):
+    """Test add_to_composition creates ComponentInstance."""
+    result = add_fn(stub_builder, **timing, **props)
+
+    assert result is stub_builder
+    assert len(stub_builder.components) == 1
+    component = stub_builder.components[0]
+    assert component.component_type == component_name
+    for key, value in props.items():
+        assert component.props[key] == value
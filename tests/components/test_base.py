@@ -6,14 +6,16 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
+from chuk_motion.components.base import ComponentInfo, ComponentMetadata
+
+pytestmark = pytest.mark.xdist_group("components_light")
+
 
 class TestComponentMetadata:
     """Tests for ComponentMetadata model."""
 
     def test_component_metadata_creation(self):
         """Test creating ComponentMetadata instance."""
-        from chuk_motion.components.base import ComponentMetadata
-
         metadata = ComponentMetadata(
             name="TestComponent", description="A test component", category="test"
         )
@@ -24,8 +26,6 @@ class TestComponentMetadata:
 
     def test_component_metadata_forbids_extra_fields(self):
         """Test that ComponentMetadata rejects extra fields."""
-        from chuk_motion.components.base import ComponentMetadata
-
         with pytest.raises(ValidationError):
             ComponentMetadata(
                 name="Test", description="Test", category="test", extra_field="not allowed"
@@ -37,8 +37,6 @@ class TestComponentInfo:
 
     def test_component_info_basic(self):
         """Test creating ComponentInfo with minimal fields."""
-        from chuk_motion.components.base import ComponentInfo, ComponentMetadata
-
         metadata = ComponentMetadata(name="TestComponent", description="Test", category="test")
 
         info = ComponentInfo(metadata=metadata)
@@ -51,8 +49,6 @@ class TestComponentInfo:
 
     def test_component_info_all_fields(self):
         """Test creating ComponentInfo with all fields."""
-        from chuk_motion.components.base import ComponentInfo, ComponentMetadata
-
         metadata = ComponentMetadata(name="TestComponent", description="Test", category="test")
 
         def mock_register_tool():
@@ -79,8 +75,6 @@ class TestComponentInfo:
 
     def test_component_info_name_property(self):
         """Test ComponentInfo.name property."""
-        from chuk_motion.components.base import ComponentInfo, ComponentMetadata
-
         metadata = ComponentMetadata(name="MyComponent", description="Test", category="test")
 
         info = ComponentInfo(metadata=metadata)
@@ -91,8 +85,6 @@ class TestComponentInfo:
 
     def test_component_info_category_property(self):
         """Test ComponentInfo.category property."""
-        from chuk_motion.components.base import ComponentInfo, ComponentMetadata
-
         metadata = ComponentMetadata(name="Test", description="Test", category="overlay")
 
         info = ComponentInfo(metadata=metadata)
@@ -103,8 +95,6 @@ class TestComponentInfo:
 
     def test_component_info_forbids_extra_fields(self):
         """Test that ComponentInfo rejects extra fields."""
-        from chuk_motion.components.base import ComponentInfo, ComponentMetadata
-
         metadata = ComponentMetadata(name="Test", description="Test", category="test")
 
         with pytest.raises(ValidationError):
@@ -11,6 +11,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -107,7 +108,7 @@ class TestFuzzyTextToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(text="Test", duration=3.0))
 
@@ -125,7 +126,7 @@ class TestFuzzyTextToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(text="Test", duration=3.0))
 
@@ -144,7 +145,7 @@ class TestFuzzyTextToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Mock add_component to raise exception
         with patch.object(timeline, "add_component", side_effect=Exception("Test error")):
@@ -165,7 +166,7 @@ class TestFuzzyTextToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         result = asyncio.run(tool_func(text="Test", text_color="#FF0000", duration=3.0))
 
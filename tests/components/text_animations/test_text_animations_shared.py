@@ -0,0 +1,186 @@
+"""Shared builder and MCP tool tests for text animation components."""
+
+from types import SimpleNamespace
+
+import pytest
+from tests.components.conftest import assert_tool_error, parse_tool_result, raising
+
+from chuk_motion.components.text_animations.DecryptedText.builder import (
+    add_to_composition as add_decrypted_text,
+)
+from chuk_motion.components.text_animations.DecryptedText.tool import (
+    register_tool as register_decrypted_text,
+)
+from chuk_motion.components.text_animations.StaggerText.builder import (
+    add_to_composition as add_stagger_text,
+)
+from chuk_motion.components.text_animations.StaggerText.tool import (
+    register_tool as register_stagger_text,
+)
+from chuk_motion.components.text_animations.TrueFocus.builder import (
+    add_to_composition as add_true_focus,
+)
+from chuk_motion.components.text_animations.TrueFocus.tool import (
+    register_tool as register_true_focus,
+)
+from chuk_motion.components.text_animations.TypewriterText.builder import (
+    add_to_composition as add_typewriter_text,
+)
+from chuk_motion.components.text_animations.TypewriterText.tool import (
+    register_tool as register_typewriter_text,
+)
+from chuk_motion.components.text_animations.WavyText.builder import (
+    add_to_composition as add_wavy_text,
+)
+from chuk_motion.components.text_animations.WavyText.tool import (
+    register_tool as register_wavy_text,
+)
+
+pytestmark = pytest.mark.xdist_group("text_animations_shared")
+
+# component name -> add_to_composition
+BUILDERS = {
+    "DecryptedText": add_decrypted_text,
+    "StaggerText": add_stagger_text,
+    "TrueFocus": add_true_focus,
+    "TypewriterText": add_typewriter_text,
+    "WavyText": add_wavy_text,
+}
+
+# component name -> (register_tool, MCP tool name)
+TOOLS = {
+    "DecryptedText": (register_decrypted_text, "remotion_add_decrypted_text"),
+    "StaggerText": (register_stagger_text, "remotion_add_stagger_text"),
+    "TrueFocus": (register_true_focus, "remotion_add_true_focus"),
+    "TypewriterText": (register_typewriter_text, "remotion_add_typewriter_text"),
+    "WavyText": (register_wavy_text, "remotion_add_wavy_text"),
+}
+
+# Timeline method made to raise in the error-handling test
+FAILING_METHODS = {
+    "DecryptedText": "get_total_duration_seconds",
+    "StaggerText": "add_stagger_text",
+    "TrueFocus": "add_component",
+    "TypewriterText": "add_typewriter_text",
+    "WavyText": "add_wavy_text",
+}
+
+# component name -> (optional color kwargs, props they must set)
+COLORS = {
+    "DecryptedText": ({"text_color": "#FF0000"}, {"textColor": "#FF0000"}),
+    "StaggerText": ({"text_color": "#FF0000"}, {"textColor": "#FF0000"}),
+    "TrueFocus": (
+        {"text_color": "#FF0000", "frame_color": "#00FF00", "glow_color": "#0000FF"},
+        {"textColor": "#FF0000", "frameColor": "#00FF00", "glowColor": "#0000FF"},
+    ),
+    "TypewriterText": (
+        {"text_color": "#FF0000", "cursor_color": "#00FF00"},
+        {"textColor": "#FF0000", "cursorColor": "#00FF00"},
+    ),
+    "WavyText": ({"text_color": "#FF0000"}, {"textColor": "#FF0000"}),
+}
+
+text_animations = pytest.mark.parametrize("component_name", list(TOOLS))
+
+
+@pytest.fixture
+def registered_tool(mock_mcp_server, project_manager, timeline, component_name):
+    """Register the tool against a fresh timeline and return (tool_func, timeline)."""
+    register_tool, tool_name = TOOLS[component_name]
+    project_manager.current_timeline = timeline
+
+    register_tool(mock_mcp_server, project_manager)
+    return mock_mcp_server.tools[tool_name], timeline
+
+
+@text_animations
+def test_add_to_composition_basic(stub_builder, component_name):
+    """Test add_to_composition creates ComponentInstance."""
+    result = BUILDERS[component_name](stub_builder, text="Test", start_time=0.0)
+
+    assert result is stub_builder
+    assert len(stub_builder.components) == 1
+    assert stub_builder.components[0].component_type == component_name
+    assert stub_builder.components[0].props["text"] == "Test"
+
+
+@text_animations
+def test_add_to_composition_with_colors(stub_builder, component_name):
+    """Test add_to_composition with optional color parameters."""
+    color_kwargs, expected = COLORS[component_name]
+    result = BUILDERS[component_name](stub_builder, text="Test", start_time=0.0, **color_kwargs)
+
+    assert result is stub_builder
+    assert len(stub_builder.components) == 1
+    props = stub_builder.components[0].props
+    assert {key: props[key] for key in expected} == expected
+
+
+@text_animations
+def test_register_tool(mock_mcp_server, project_manager, component_name):
+    """Test tool registration."""
+    register_tool, tool_name = TOOLS[component_name]
+
+    register_tool(mock_mcp_server, project_manager)
+
+    assert list(mock_mcp_server.tools) == [tool_name]
+
+
+@text_animations
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tool_execution(registered_tool, component_name):
+    """Test tool execution creates component."""
+    tool_func, timeline = registered_tool
+
+    result = await tool_func(text="Test", duration=3.0)
+
+    # Check component was added
+    assert len(timeline.get_all_components()) >= 1
+    assert parse_tool_result(result)["component"] == component_name
+
+
+@text_animations
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tool_execution_no_project(mock_mcp_server, component_name):
+    """Test tool execution when no project exists."""
+    register_tool, tool_name = TOOLS[component_name]
+    # The tools only read current_timeline before bailing out
+    project_manager = SimpleNamespace(current_timeline=None)
+    register_tool(mock_mcp_server, project_manager)
+
+    result = await mock_mcp_server.tools[tool_name](text="Test", duration=3.0)
+
+    assert_tool_error(result, "No active project")
+
+
+@text_animations
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tool_execution_error_handling(mock_mcp_server, project_manager, component_name):
+    """Test tool execution handles exceptions."""
+    register_tool, tool_name = TOOLS[component_name]
+    # The tools only read the current duration before adding, so a stub timeline suffices
+    timeline = SimpleNamespace(get_total_duration_seconds=lambda: 0.0)
+    setattr(timeline, FAILING_METHODS[component_name], raising("Test error"))
+    project_manager.current_timeline = timeline
+    register_tool(mock_mcp_server, project_manager)
+
+    result = await mock_mcp_server.tools[tool_name](text="Test", duration=3.0)
+
+    assert_tool_error(result, "Test error")
+
+
+@text_animations
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tool_execution_with_colors(registered_tool, component_name):
+    """Test tool execution with optional color parameters."""
+    tool_func, timeline = registered_tool
+    color_kwargs, expected = COLORS[component_name]
+
+    result = await tool_func(text="Test", duration=3.0, **color_kwargs)
+
+    # Check component was added with the colors
+    components = timeline.get_all_components()
+    assert len(components) >= 1
+    props = components[0].props
+    assert {key: props.get(key) for key in expected} == expected
+    assert parse_tool_result(result)["component"] == component_name
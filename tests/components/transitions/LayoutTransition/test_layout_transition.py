@@ -10,6 +10,7 @@ from tests.components.conftest import (
     assert_has_timing_props,
     assert_has_visibility_check,
     assert_valid_typescript,
+    extract_tool,
 )
 
 
@@ -111,7 +112,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Create valid first and second content
         first_content = json.dumps({"type": "TitleScene", "config": {"text": "First"}})
@@ -137,7 +138,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         first_content = json.dumps({"type": "Grid", "config": {"layout": "2x2"}})
         second_content = json.dumps({"type": "Container", "config": {"position": "center"}})
@@ -179,7 +180,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         first_content = json.dumps({"type": "TitleScene", "config": {"text": "First"}})
         second_content = json.dumps({"type": "TitleScene", "config": {"text": "Second"}})
@@ -206,7 +207,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         first_content = json.dumps({"type": "TitleScene", "config": {"text": "First"}})
         second_content = json.dumps({"type": "TitleScene", "config": {"text": "Second"}})
@@ -234,7 +235,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(
             tool_func(
@@ -258,7 +259,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         result = asyncio.run(
             tool_func(
@@ -283,7 +284,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         # Missing 'type' key
         first_content = json.dumps({"config": {"text": "First"}})
@@ -307,7 +308,7 @@ class TestLayoutTransitionToolRegistration:
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
 
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         first_content = json.dumps({"type": "TitleScene", "config": {"text": "First"}})
         second_content = json.dumps({"type": "TitleScene", "config": {"text": "Second"}})
@@ -331,7 +332,7 @@ class TestLayoutTransitionToolRegistration:
 
         mcp_mock = Mock()
         register_tool(mcp_mock, pm_mock)
-        tool_func = mcp_mock.tool.call_args[0][0]
+        tool_func = extract_tool(mcp_mock)
 
         first_content = json.dumps({"type": "TitleScene", "config": {"text": "First"}})
         second_content = json.dumps({"type": "TitleScene", "config": {"text": "Second"}})
@@ -5,6 +5,8 @@ import asyncio
 import json
 from unittest.mock import Mock
 
+from tests.components.conftest import extract_tool
+
 
 class TestPixelTransitionBuilderMethod:
     """Tests for PixelTransition builder method."""
@@ -159,7 +161,7 @@ class TestPixelTransitionToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Create JSON for first and second content
         first_content_json = json.dumps(
@@ -193,7 +195,7 @@ class TestPixelTransitionToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         first_content_json = json.dumps(
             {"component_type": "TitleScene", "props": {"text": "Before"}}
@@ -229,7 +231,7 @@ class TestPixelTransitionToolRegistration:
         project_manager.current_timeline = None  # No project
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         first_content_json = json.dumps({"component_type": "TitleScene", "props": {}})
         second_content_json = json.dumps({"component_type": "TitleScene", "props": {}})
@@ -259,7 +261,7 @@ class TestPixelTransitionToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         first_content_json = json.dumps({"component_type": "TitleScene", "props": {}})
         second_content_json = json.dumps({"component_type": "TitleScene", "props": {}})
@@ -287,7 +289,7 @@ class TestPixelTransitionToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # Invalid JSON
         result = asyncio.run(
@@ -312,7 +314,7 @@ class TestPixelTransitionToolRegistration:
         project_manager.current_timeline = timeline
 
         register_tool(mcp, project_manager)
-        tool_func = mcp.tool.call_args[0][0]
+        tool_func = extract_tool(mcp)
 
         # JSON null will parse to Python None, triggering the error
         null_content = "null"